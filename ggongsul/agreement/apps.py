@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class AgreementConfig(AppConfig):
     name = "ggongsul.agreement"
     verbose_name = _("이용 약관")
+
+    def ready(self):
+        import ggongsul.agreement.signals
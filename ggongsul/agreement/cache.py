@@ -0,0 +1,42 @@
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from ggongsul.common.cache import TieredCache
+from ggongsul.core.mixins import bump_response_version, get_response_version
+
+LIST_KEY = "list"
+RESPONSE_VERSION_NAME = "agreement"
+
+
+class AgreementPayload(NamedTuple):
+    content: bytes
+    content_type: str
+    etag: str
+    last_modified: Optional[int]
+
+
+# payload 형식이 바뀌면 이름의 버전을 올려서 이전 배포에서 만든 캐시를 무시한다.
+payload_cache = TieredCache(
+    "agreement.payload.v1",
+    max_size=settings.AGREEMENT_CACHE_MAX_SIZE,
+    ttl=settings.AGREEMENT_CACHE_TTL,
+    local_ttl=settings.AGREEMENT_CACHE_LOCAL_TTL,
+)
+
+
+def payload_key(key: str) -> Optional[str]:
+    """
+    Returns the cache key of the payload, which changes whenever an
+    agreement is changed, None if the version can not be read.
+    """
+    version = get_response_version(RESPONSE_VERSION_NAME)
+    if version is None:
+        return None
+    return f"{version}:{key}"
+
+
+def invalidate_agreement_payload():
+    # commit 이후에 버전을 올리므로 commit 전에 이전 본문을 읽은 요청은 더 이상 조회되지 않는 키에 저장한다.
+    transaction.on_commit(lambda: bump_response_version(RESPONSE_VERSION_NAME))
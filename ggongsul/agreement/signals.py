@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_agreement_payload
+from .models import Agreement
+
+
+@receiver(post_save, sender=Agreement)
+@receiver(post_delete, sender=Agreement)
+def invalidate_payload(sender, instance, **kwargs):
+    invalidate_agreement_payload()
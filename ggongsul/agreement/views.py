@@ -1,18 +1,98 @@
+import hashlib
+
+from typing import Callable, Optional, Tuple
+
+from django.http import HttpResponse
 from rest_framework import permissions
+from rest_framework.request import Request
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from ggongsul.agreement.cache import (
+    AgreementPayload,
+    LIST_KEY,
+    payload_cache,
+    payload_key,
+)
 from ggongsul.agreement.models import Agreement
 from ggongsul.agreement.serializers import (
     AgreementFullSerializer,
     AgreementShortSerializer,
 )
+from ggongsul.core.mixins import ConditionalGetMixin, to_timestamp
+from ggongsul.core.renderers import is_plain_json
 
 
-class AgreementViewSet(ReadOnlyModelViewSet):
+class AgreementViewSet(ConditionalGetMixin, ReadOnlyModelViewSet):
     queryset = Agreement.objects.all()
     permission_classes = [permissions.AllowAny]
+    cache_control = {
+        "list": {"public": True, "max_age": 60 * 60},
+        "retrieve": {"public": True, "max_age": 60 * 60},
+    }
 
     def get_serializer_class(self):
         if self.action == "list":
             return AgreementShortSerializer
         return AgreementFullSerializer
+
+    def get_payload(
+        self, key: str, build_data: Callable[[], Tuple[object, object]]
+    ) -> Optional[AgreementPayload]:
+        # 캐시된 본문은 기본 json 형식이므로 indent 등이 지정된 요청은 직접 만든다.
+        if not is_plain_json(self.request):
+            return None
+
+        key = payload_key(key)
+        if key is None:
+            return None
+        return payload_cache.get_or_set(key, lambda: self.build_payload(*build_data()))
+
+    def build_payload(self, data, last_modified) -> AgreementPayload:
+        renderer = self.request.accepted_renderer
+        content = renderer.render(data)
+
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+
+        return AgreementPayload(
+            content=content,
+            content_type=content_type,
+            etag=hashlib.sha1(content).hexdigest(),
+            last_modified=to_timestamp(last_modified),
+        )
+
+    def payload_response(self, request: Request, payload: AgreementPayload):
+        response = self.get_not_modified_response(
+            request, payload.etag, payload.last_modified
+        )
+        if response is None:
+            response = HttpResponse(payload.content, content_type=payload.content_type)
+
+        self.add_conditional_headers(response, payload.etag, payload.last_modified)
+        return response
+
+    def build_list_data(self):
+        agreements = list(self.filter_queryset(self.get_queryset()))
+        data = self.get_serializer(agreements, many=True).data
+        return data, max((a.updated_on for a in agreements), default=None)
+
+    def build_retrieve_data(self):
+        agreement = self.get_object()
+        return self.get_serializer(agreement).data, agreement.updated_on
+
+    def list(self, request: Request, *args, **kwargs):
+        payload = self.get_payload(LIST_KEY, self.build_list_data)
+        if payload is None:
+            return super().list(request, *args, **kwargs)
+        return self.payload_response(request, payload)
+
+    def retrieve(self, request: Request, *args, **kwargs):
+        pk = kwargs.get(self.lookup_url_kwarg or self.lookup_field, "")
+        if not pk.isdigit():
+            return super().retrieve(request, *args, **kwargs)
+
+        payload = self.get_payload(str(int(pk)), self.build_retrieve_data)
+        if payload is None:
+            return super().retrieve(request, *args, **kwargs)
+        return self.payload_response(request, payload)
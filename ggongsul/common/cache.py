@@ -0,0 +1,218 @@
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache whose entries expire after ttl seconds.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        with self._lock:
+            item = self._data.get(key, MISSING)
+            if item is MISSING:
+                return default
+
+            expire_at, value = item
+            if expire_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class TieredCache:
+    """
+    In-process LRU cache backed by a django cache shared between workers.
+    """
+
+    STAT_KEYS = ("local_hit", "shared_hit", "miss")
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: int,
+        shared_alias: str = "shared",
+        stats_flush_interval: int = 100,
+        local_ttl: int = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.shared_alias = shared_alias
+        self.stats_flush_interval = stats_flush_interval
+        # 다른 worker 의 delete 는 local 캐시에 전달되지 않으므로 local_ttl 로 수명을 제한한다.
+        self._local = LRUCache(max_size, local_ttl or ttl)
+        self._stats = dict.fromkeys(self.STAT_KEYS, 0)
+        self._unflushed = dict.fromkeys(self.STAT_KEYS, 0)
+        self._stats_lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _stats_key(self, stat: str) -> str:
+        return f"{self.name}:stats:{stat}"
+
+    def _count(self, stat: str):
+        with self._stats_lock:
+            self._stats[stat] += 1
+            self._unflushed[stat] += 1
+            if sum(self._unflushed.values()) < self.stats_flush_interval:
+                return
+            unflushed = self._unflushed
+            self._unflushed = dict.fromkeys(self.STAT_KEYS, 0)
+
+        self._flush_stats(unflushed)
+
+    def _flush_stats(self, unflushed: Dict[str, int]):
+        try:
+            for stat, cnt in unflushed.items():
+                if not cnt:
+                    continue
+                key = self._stats_key(stat)
+                self.shared.add(key, 0, timeout=None)
+                self.shared.incr(key, cnt)
+        except Exception:
+            logger.warning(f"failed to flush stats of {self.name} cache")
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        value = self._local.get(key)
+        if value is not MISSING:
+            self._count("local_hit")
+            return value
+
+        try:
+            value = self.shared.get(self._shared_key(key), MISSING)
+        except Exception:
+            # shared 캐시 장애가 요청 실패로 이어지지 않도록 한다.
+            logger.warning(f"failed to read {self.name} cache from shared tier")
+            value = MISSING
+
+        if value is not MISSING:
+            self._local.set(key, value)
+            self._count("shared_hit")
+            return value
+
+        self._count("miss")
+        return default
+
+    def set(self, key: str, value: Any):
+        self._local.set(key, value)
+        try:
+            self.shared.set(self._shared_key(key), value, timeout=self.ttl)
+        except Exception:
+            logger.warning(f"failed to write {self.name} cache to shared tier")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Returns the cached values of keys, reading the shared tier once for
+        the keys missing in this process.
+        """
+        result = {}
+        missing = []
+        for key in keys:
+            value = self._local.get(key)
+            if value is MISSING:
+                missing.append(key)
+            else:
+                result[key] = value
+                self._count("local_hit")
+
+        if not missing:
+            return result
+
+        try:
+            shared = self.shared.get_many([self._shared_key(key) for key in missing])
+        except Exception:
+            logger.warning(f"failed to read {self.name} cache from shared tier")
+            shared = {}
+
+        for key in missing:
+            value = shared.get(self._shared_key(key), MISSING)
+            if value is MISSING:
+                self._count("miss")
+                continue
+
+            self._local.set(key, value)
+            result[key] = value
+            self._count("shared_hit")
+        return result
+
+    def set_many(self, data: Dict[str, Any]):
+        for key, value in data.items():
+            self._local.set(key, value)
+        try:
+            self.shared.set_many(
+                {self._shared_key(key): value for key, value in data.items()},
+                timeout=self.ttl,
+            )
+        except Exception:
+            logger.warning(f"failed to write {self.name} cache to shared tier")
+
+    def delete(self, key: str):
+        self._local.delete(key)
+        try:
+            self.shared.delete(self._shared_key(key))
+        except Exception:
+            logger.warning(f"failed to delete {self.name} cache from shared tier")
+
+    def get_or_set(self, key: str, func: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is MISSING:
+            value = func()
+            self.set(key, value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit/miss counters of this process.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def shared_stats(self) -> Dict[str, int]:
+        """
+        Returns the hit/miss counters flushed by every worker.
+        """
+        keys = {stat: self._stats_key(stat) for stat in self.STAT_KEYS}
+        values = self.shared.get_many(keys.values())
+        return {stat: values.get(key, 0) for stat, key in keys.items()}
@@ -0,0 +1,141 @@
+from typing import Optional, Tuple
+
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+class RelatedCounter:
+    """
+    Counts the rows of a reverse foreign key relation of a model instance.
+
+    The count is read from the queryset annotation when the instance was
+    loaded with `annotate`, and otherwise with a COUNT(*) query.
+    """
+
+    def __init__(self, related_name: str, annotation: str, filters: dict = None):
+        self.related_name = related_name
+        self.annotation = annotation
+        self.filters = filters or {}
+
+    def _related_field(self, model):
+        return model._meta.get_field(self.related_name)
+
+    def subquery(self, model) -> Coalesce:
+        """
+        Returns the count expression of the relation for querysets of model.
+
+        A correlated subquery is used instead of Count() over a join so that
+        several counters can be annotated without multiplying rows.
+        """
+        field = self._related_field(model)
+        related_model = field.related_model
+        fk_name = field.field.name
+
+        queryset = (
+            related_model.objects.filter(**{fk_name: OuterRef("pk")}, **self.filters)
+            .order_by()
+            .values(fk_name)
+            .annotate(cnt=Count("pk"))
+            .values("cnt")
+        )
+        return Coalesce(Subquery(queryset, output_field=models.IntegerField()), 0)
+
+    def annotate(self, queryset):
+        return queryset.annotate(**{self.annotation: self.subquery(queryset.model)})
+
+    def count(self, instance) -> int:
+        if hasattr(instance, self.annotation):
+            return getattr(instance, self.annotation)
+        return getattr(instance, self.related_name).filter(**self.filters).count()
+
+
+class CounterFieldsMixin:
+    """
+    Saves existing rows without COUNTER_FIELDS, which are only changed with
+    F() updates, so that a stale instance does not overwrite them.
+    """
+
+    COUNTER_FIELDS: Tuple[str, ...] = ()
+
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            kwargs["update_fields"] = [
+                f.name
+                for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class CountedMixin:
+    """
+    Keeps the counters of other rows in sync with the rows of this model.
+
+    The stored COUNTED_FIELDS are read with the row locked before it is
+    saved or deleted, so that concurrent or stale copies of a row change
+    the counters only once. Deletes, including queryset deletes, are
+    counted by connecting `counted_pre_delete` and `counted_post_delete`
+    to the model.
+    """
+
+    COUNTED_FIELDS: Tuple[str, ...]
+
+    def counted_value(self, values: dict):
+        """
+        Returns what a row with `values` adds to the counters, None if it
+        is not counted.
+        """
+        raise NotImplementedError
+
+    def update_counters(self, old_value, new_value):
+        raise NotImplementedError
+
+    def lock_saved_values(self) -> Optional[dict]:
+        if self._state.adding:
+            return None
+        return (
+            type(self)
+            ._base_manager.select_for_update()
+            .filter(pk=self.pk)
+            .values(*self.COUNTED_FIELDS)
+            .first()
+        )
+
+    def sync_counters(self, saved: Optional[dict], current: Optional[dict]):
+        old_value = None if saved is None else self.counted_value(saved)
+        new_value = None if current is None else self.counted_value(current)
+        if old_value != new_value:
+            self.update_counters(old_value, new_value)
+
+    def _is_saved_field(self, field: str, update_fields) -> bool:
+        if update_fields is None:
+            return True
+        return (
+            field in update_fields or self._meta.get_field(field).name in update_fields
+        )
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            saved = self.lock_saved_values()
+            super().save(*args, **kwargs)
+
+            # update_fields 에 포함되지 않은 필드는 저장된 값이 그대로 남는다.
+            current = dict(saved or {})
+            for field in self.COUNTED_FIELDS:
+                if self._is_saved_field(field, kwargs.get("update_fields")):
+                    current[field] = getattr(self, field)
+            self.sync_counters(saved, current)
+
+
+def counted_pre_delete(sender, instance: CountedMixin, **kwargs):
+    # 삭제 transaction 안에서 row 를 잠그고 저장된 값을 읽는다.
+    instance._saved_before_delete = instance.lock_saved_values()
+
+
+def counted_post_delete(sender, instance: CountedMixin, **kwargs):
+    instance.sync_counters(getattr(instance, "_saved_before_delete", None), None)
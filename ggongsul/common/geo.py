@@ -0,0 +1,62 @@
+import math
+
+from typing import Tuple
+
+from django.db.models import F, ExpressionWrapper, FloatField
+from django.db.models.functions import Radians, Power, Sin, Cos, ATan2, Sqrt
+
+EARTH_RADIUS_KM = 6371
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Returns the great-circle distance in km between two points.
+    """
+    dlat = math.radians(lat2 - lat1)
+    dlng = math.radians(lng2 - lng1)
+
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(math.radians(lat1))
+        * math.cos(math.radians(lat2))
+        * math.sin(dlng / 2) ** 2
+    )
+
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return EARTH_RADIUS_KM * c
+
+
+def haversine_expression(
+    lat: float, lng: float, lat_field="latitude", lng_field="longitude"
+):
+    """
+    Returns a db expression of the great-circle distance in km from (lat, lng).
+    """
+    dlat = Radians(F(lat_field) - lat)
+    dlong = Radians(F(lng_field) - lng)
+
+    a = Power(Sin(dlat / 2), 2) + Cos(Radians(lat)) * Cos(
+        Radians(F(lat_field))
+    ) * Power(Sin(dlong / 2), 2)
+
+    c = 2 * ATan2(Sqrt(a), Sqrt(1 - a))
+    # decimal 좌표에서 계산되더라도 cursor 에 그대로 담을 수 있도록 float 로 받는다.
+    return ExpressionWrapper(EARTH_RADIUS_KM * c, output_field=FloatField())
+
+
+def bounding_box(
+    lat: float, lng: float, num_km: float
+) -> Tuple[float, float, float, float]:
+    """
+    Returns (min_lat, max_lat, min_lng, max_lng) of the box which contains
+    every point within num_km from (lat, lng).
+    """
+    dlat = math.degrees(num_km / EARTH_RADIUS_KM)
+
+    cos_lat = math.cos(math.radians(lat))
+    # 극지방에서는 경도 범위가 의미가 없으므로 전체 범위를 사용
+    if cos_lat < 1e-6:
+        return lat - dlat, lat + dlat, -180.0, 180.0
+
+    dlng = min(math.degrees(num_km / (EARTH_RADIUS_KM * cos_lat)), 180.0)
+    return lat - dlat, lat + dlat, lng - dlng, lng + dlng
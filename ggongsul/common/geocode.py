@@ -0,0 +1,47 @@
+import hashlib
+
+from django.conf import settings
+
+from ggongsul.common.cache import TieredCache
+from ggongsul.lib.kakao import KakaoApiHelper
+
+region_cache = TieredCache(
+    "geocode.region",
+    max_size=settings.GEOCODE_CACHE_MAX_SIZE,
+    ttl=settings.GEOCODE_CACHE_TTL,
+    stats_flush_interval=settings.GEOCODE_CACHE_STATS_FLUSH_INTERVAL,
+)
+address_cache = TieredCache(
+    "geocode.address",
+    max_size=settings.GEOCODE_CACHE_MAX_SIZE,
+    ttl=settings.GEOCODE_CACHE_TTL,
+    stats_flush_interval=settings.GEOCODE_CACHE_STATS_FLUSH_INTERVAL,
+)
+
+
+def coord_cell_key(lng: float, lat: float, precision: int = None) -> str:
+    if precision is None:
+        precision = settings.GEOCODE_CACHE_PRECISION
+    return f"{lng:.{precision}f},{lat:.{precision}f}"
+
+
+def address_query_key(query: str) -> str:
+    normalized = " ".join(query.split())
+    return hashlib.md5(normalized.encode("utf-8")).hexdigest()
+
+
+def cached_coord_to_region(lng: float, lat: float) -> dict:
+    """
+    Returns the coord2regioncode response of the grid cell containing (lng, lat).
+    """
+    return region_cache.get_or_set(
+        coord_cell_key(lng, lat),
+        lambda: KakaoApiHelper().coord_to_region(lng=lng, lat=lat),
+    )
+
+
+def cached_search_address(query: str) -> dict:
+    return address_cache.get_or_set(
+        address_query_key(query),
+        lambda: KakaoApiHelper().search_address(query),
+    )
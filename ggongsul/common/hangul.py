@@ -0,0 +1,90 @@
+import re
+import unicodedata
+
+from typing import List
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# 입력 중에는 겹모음, 겹받침이 나누어져 있으므로 기본 자모로 풀어서 비교한다.
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+_word_re = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    # NFKC 는 호환 자모(ㄱ)를 조합형 자모로 바꾸므로 NFC 로 정규화한다.
+    return unicodedata.normalize("NFC", text or "").lower()
+
+
+def words(text: str) -> List[str]:
+    return _word_re.findall(normalize(text))
+
+
+def is_syllable(ch: str) -> bool:
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def to_jamo(text: str) -> str:
+    """
+    Decomposes hangul syllables into basic compatibility jamo, e.g.
+    "껍데기" -> "ㄲㅓㅂㄷㅔㄱㅣ", so that a partially typed word is a prefix.
+    """
+    result = []
+    for ch in text:
+        if not is_syllable(ch):
+            result.append(COMPOUND_JAMO.get(ch, ch))
+            continue
+
+        code = ord(ch) - HANGUL_BASE
+        result.append(CHOSUNG[code // 588])
+        result.append(
+            COMPOUND_JAMO.get(JUNGSUNG[code % 588 // 28], JUNGSUNG[code % 588 // 28])
+        )
+        jong = JONGSUNG[code % 28]
+        if jong != " ":
+            result.append(COMPOUND_JAMO.get(jong, jong))
+    return "".join(result)
+
+
+def to_chosung(text: str) -> str:
+    """
+    Returns the initial consonants of the syllables, e.g. "껍데기" -> "ㄲㄷㄱ".
+    """
+    return "".join(
+        CHOSUNG[(ord(ch) - HANGUL_BASE) // 588] if is_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def is_chosung_only(text: str) -> bool:
+    return bool(text) and all(ch in CHOSUNG for ch in text)
+
+
+def ngrams(word: str, n: int = 2) -> List[str]:
+    if len(word) <= n:
+        return [word]
+    return [word[i : i + n] for i in range(len(word) - n + 1)]
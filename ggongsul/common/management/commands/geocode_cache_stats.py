@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from ggongsul.common.geocode import address_cache, region_cache
+
+
+class Command(BaseCommand):
+    help = "Shows the hit/miss counters of the geocode caches flushed by workers."
+
+    def handle(self, *args, **options):
+        for cache in [region_cache, address_cache]:
+            stats = cache.shared_stats()
+            total = sum(stats.values())
+            hit_ratio = (
+                (stats["local_hit"] + stats["shared_hit"]) / total if total else 0
+            )
+
+            self.stdout.write(
+                f"{cache.name}: "
+                + ", ".join(f"{k}={v}" for k, v in stats.items())
+                + f", hit_ratio={hit_ratio:.2%}"
+            )
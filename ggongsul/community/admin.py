@@ -23,3 +23,4 @@ class PostAdmin(admin.ModelAdmin):
     readonly_fields = ("is_deleted", "deleted_on", "created_on", "updated_on")
     exclude = ("longitude", "latitude")
     list_display = ("__str__", "total_comment_cnt", "total_attention_cnt", "is_deleted")
+    list_select_related = ("member",)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from ggongsul.community.models import Post
+from ggongsul.community.tasks import update_post_address
+
+
+class Command(BaseCommand):
+    help = "Resolves the address of posts which have coordinates but no address."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Resolves addresses in this process instead of enqueueing tasks.",
+        )
+
+    def handle(self, *args, **options):
+        post_ids = Post.objects.filter(
+            Q(address__isnull=True) | Q(address=""),
+            longitude__isnull=False,
+            latitude__isnull=False,
+        ).values_list("id", flat=True)
+
+        cnt = 0
+        for post_id in post_ids.iterator():
+            if options["sync"]:
+                update_post_address.apply(args=(post_id,))
+            else:
+                update_post_address.delay(post_id)
+            cnt += 1
+
+        self.stdout.write(self.style.SUCCESS(f"backfilled post count: {cnt}"))
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ggongsul.community.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the attention/comment counters of posts and fixes the drifted ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only reports the drifted posts.",
+        )
+
+    def _with_expected_counts(self, queryset):
+        queryset = Post.attention_counter.annotate(queryset)
+        return Post.comment_counter.annotate(queryset)
+
+    def handle(self, *args, **options):
+        posts = self._with_expected_counts(
+            Post.objects.only("id", *Post.COUNTER_FIELDS)
+        )
+
+        drifted_ids = [
+            post.id
+            for post in posts.iterator()
+            if (post.attention_count, post.comment_count)
+            != (post.attention_cnt, post.comment_cnt)
+        ]
+
+        self.stdout.write(f"drifted post count: {len(drifted_ids)}")
+        if options["dry_run"] or not drifted_ids:
+            return
+
+        for post_id in drifted_ids:
+            # 게시글 row 를 잠근 뒤 다시 계산해서 동시에 들어온 갱신과 충돌하지 않도록 한다.
+            with transaction.atomic():
+                Post.objects.select_for_update().filter(pk=post_id).first()
+                post = self._with_expected_counts(Post.objects.filter(pk=post_id)).get()
+                Post.objects.filter(pk=post_id).update(
+                    attention_count=post.attention_cnt, comment_count=post.comment_cnt
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"reconciled post count: {len(drifted_ids)}")
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0005_post_address"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="community_p_latitud_3a0021_idx"
+            ),
+        ),
+    ]
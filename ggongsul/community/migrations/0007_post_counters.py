@@ -0,0 +1,46 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:20
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_post_counters(apps, schema_editor):
+    Post = apps.get_model("community", "Post")
+
+    for model_name, field in [
+        ("Attention", "attention_count"),
+        ("Comment", "comment_count"),
+    ]:
+        model = apps.get_model("community", model_name)
+        counts = (
+            model.objects.filter(is_deleted=False)
+            .values("post")
+            .annotate(cnt=Count("id"))
+        )
+        for row in counts:
+            Post.objects.filter(pk=row["post"]).update(**{field: row["cnt"]})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0006_auto_20261018_1905"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="attention_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="전체 좋아요 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="comment_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="전체 댓글 수"
+            ),
+        ),
+        migrations.RunPython(fill_post_counters, migrations.RunPython.noop),
+    ]
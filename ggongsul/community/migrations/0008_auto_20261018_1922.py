@@ -0,0 +1,19 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("community", "0007_post_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["created_on", "id"], name="community_p_created_1870d9_idx"
+            ),
+        ),
+    ]
@@ -3,9 +3,13 @@ from __future__ import annotations
 import os
 import uuid
 
+from typing import Optional
+
 from django.db import models
+from django.db.models import F
 from django.utils.deconstruct import deconstructible
 
+from ggongsul.common.counters import CountedMixin, CounterFieldsMixin, RelatedCounter
 from ggongsul.member.models import Member
 from django.utils.translation import gettext_lazy as _
 
@@ -23,7 +27,7 @@ class PathAndRename:
         return os.path.join(self.path, renamed_filename)
 
 
-class Post(models.Model):
+class Post(CounterFieldsMixin, models.Model):
     member = models.ForeignKey(
         Member,
         related_name="posts",
@@ -39,12 +43,22 @@ class Post(models.Model):
     )
     address = models.CharField(max_length=64, null=True, verbose_name=_("주소"))
 
+    # 삭제되지 않은 관심, 댓글 수로, 관심/댓글 저장 시 F() 로만 갱신된다.
+    attention_count = models.IntegerField(
+        default=0, editable=False, verbose_name=_("전체 좋아요 수")
+    )
+    comment_count = models.IntegerField(
+        default=0, editable=False, verbose_name=_("전체 댓글 수")
+    )
+
     is_deleted = models.BooleanField(default=False, verbose_name=_("삭제 여부"))
     deleted_on = models.DateTimeField(null=True, blank=True, verbose_name=_("삭제 날짜"))
 
     created_on = models.DateTimeField(auto_now_add=True, verbose_name=_("생성 날짜"))
     updated_on = models.DateTimeField(auto_now=True, verbose_name=_("최근 정보 변경 날짜"))
 
+    COUNTER_FIELDS = ("attention_count", "comment_count")
+
     def __repr__(self):
         return self.__str__()
 
@@ -55,12 +69,28 @@ class Post(models.Model):
         ordering = ["-created_on"]
         verbose_name = _("게시글")
         verbose_name_plural = _("게시글")
+        indexes = [
+            models.Index(fields=["latitude", "longitude"]),
+            models.Index(fields=["created_on", "id"]),
+        ]
+
+    # 저장된 카운터를 검증할 때 사용한다.
+    attention_counter = RelatedCounter(
+        "attentions", "attention_cnt", filters={"is_deleted": False}
+    )
+    comment_counter = RelatedCounter(
+        "comments", "comment_cnt", filters={"is_deleted": False}
+    )
+
+    @classmethod
+    def add_count(cls, post_id: int, field: str, delta: int):
+        cls.objects.filter(pk=post_id).update(**{field: F(field) + delta})
 
     def total_attention_cnt(self):
-        return len(self.attentions.filter(is_deleted=False).all())
+        return self.attention_count
 
     def total_comment_cnt(self):
-        return len(self.comments.filter(is_deleted=False).all())
+        return self.comment_count
 
     def short_body(self):
         return self.body
@@ -69,6 +99,27 @@ class Post(models.Model):
     total_comment_cnt.short_description = "전체 댓글 수"
 
 
+class PostCounted(CountedMixin):
+    """
+    Keeps the POST_COUNTER_FIELD of the post in sync with the undeleted
+    rows of a model which belongs to a post.
+    """
+
+    POST_COUNTER_FIELD: str
+    COUNTED_FIELDS = ("post_id", "is_deleted")
+
+    def counted_value(self, values: dict) -> Optional[int]:
+        if values["post_id"] is None or values["is_deleted"]:
+            return None
+        return values["post_id"]
+
+    def update_counters(self, old_post_id: Optional[int], new_post_id: Optional[int]):
+        if old_post_id:
+            Post.add_count(old_post_id, self.POST_COUNTER_FIELD, -1)
+        if new_post_id:
+            Post.add_count(new_post_id, self.POST_COUNTER_FIELD, 1)
+
+
 class PostImage(models.Model):
     post = models.ForeignKey(
         Post, related_name="images", null=True, on_delete=models.SET_NULL
@@ -92,7 +143,9 @@ class PostImage(models.Model):
         return self.__str__()
 
 
-class Comment(models.Model):
+class Comment(PostCounted, models.Model):
+    POST_COUNTER_FIELD = "comment_count"
+
     post = models.ForeignKey(
         Post,
         related_name="comments",
@@ -125,7 +178,9 @@ class Comment(models.Model):
         verbose_name_plural = _("댓글")
 
 
-class Attention(models.Model):
+class Attention(PostCounted, models.Model):
+    POST_COUNTER_FIELD = "attention_count"
+
     post = models.ForeignKey(
         Post,
         related_name="attentions",
@@ -0,0 +1,73 @@
+from collections import defaultdict
+from typing import List
+
+from django.contrib.auth.models import AnonymousUser
+from django.utils.translation import gettext_lazy as _
+
+from ggongsul.core.projections import file_url_getter, format_datetime
+from ggongsul.member.models import Member
+from ggongsul.member.serializers import MemberSerializer
+
+from .models import Attention, PostImage
+
+# PostShortInfoSerializer 와 같은 결과를 values() 로 만든다.
+
+image_url = file_url_getter(PostImage._meta.get_field("image"))
+
+FEED_ROW_FIELDS = (
+    "id",
+    "member_id",
+    "body",
+    "address",
+    "attention_count",
+    "comment_count",
+    "created_on",
+)
+
+
+def feed_rows(rows: List[dict], member) -> List[dict]:
+    """
+    Builds the feed items of values(*FEED_ROW_FIELDS) rows of posts.
+    """
+    if not rows:
+        return []
+
+    post_ids = [row["id"] for row in rows]
+
+    images = defaultdict(list)
+    image_rows = (
+        PostImage.objects.filter(post_id__in=post_ids)
+        .order_by("id")
+        .values_list("post_id", "image")
+    )
+    for post_id, name in image_rows:
+        images[post_id].append(image_url(name))
+
+    tabbed_post_ids = set()
+    if not isinstance(member, AnonymousUser):
+        tabbed_post_ids = set(
+            Attention.objects.filter(
+                member=member, is_deleted=False, post_id__in=post_ids
+            ).values_list("post_id", flat=True)
+        )
+
+    # 작성자 정보는 멤버십 계산이 필요하므로 작성자마다 한번씩만 직렬화한다.
+    members = MemberSerializer.setup_eager_loading(
+        Member.objects.filter(id__in={row["member_id"] for row in rows})
+    )
+    member_data = {m["id"]: m for m in MemberSerializer(members, many=True).data}
+
+    return [
+        {
+            "id": row["id"],
+            "member": member_data.get(row["member_id"]),
+            "short_body": row["body"],
+            "images": images[row["id"]],
+            "address": row["address"] or _("부정확한 주소"),
+            "total_attention_cnt": row["attention_count"],
+            "total_comment_cnt": row["comment_count"],
+            "is_tabbed": row["id"] in tabbed_post_ids,
+            "created_on": format_datetime(row["created_on"]),
+        }
+        for row in rows
+    ]
@@ -1,38 +1,26 @@
-from typing import Optional
-
 from django.contrib.auth.models import AnonymousUser
+from django.db import models
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
-from ggongsul.community.models import Post, Comment, PostImage
-from ggongsul.core.exceptions import BadResponse
-from ggongsul.lib.kakao import KakaoApiHelper
+from ggongsul.community.models import Post, Comment, PostImage, Attention
+from ggongsul.member.models import Member
 from ggongsul.member.serializers import MemberSerializer
 
 
-def coord_to_region(lng: float, lat: float) -> Optional[str]:
-    helper = KakaoApiHelper()
-
-    try:
-        res = helper.coord_to_region(lng=lng, lat=lat)
-    except BadResponse as e:
-        if e.status_code == -2:
-            return "부정확한 주소"
-        return None
-
-    docs = res.get("documents", [])
-    if docs:
-        return docs[0]["address_name"]
-
-    return None
+def member_prefetch(lookup: str = "member") -> Prefetch:
+    return Prefetch(
+        lookup, queryset=MemberSerializer.setup_eager_loading(Member.objects.all())
+    )
 
 
 class PostSerializer(serializers.ModelSerializer):
     def validate(self, attrs: dict):
         attrs["member"] = self.context["request"].user
-        attrs["address"] = coord_to_region(attrs["longitude"], attrs["latitude"])
+        # 주소는 게시글 생성 후 celery task 에서 채운다.
         return attrs
 
     class Meta:
@@ -48,7 +36,7 @@ class PostSerializer(serializers.ModelSerializer):
         ]
         extra_kwargs = {
             "member": {"required": False, "allow_null": True},
-            "address": {"required": False, "allow_null": True},
+            "address": {"read_only": True},
         }
 
 
@@ -94,21 +82,50 @@ class CommentSerializer(serializers.ModelSerializer):
 class CommentInfoSerializer(serializers.ModelSerializer):
     member = MemberSerializer(read_only=True)
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.prefetch_related(member_prefetch())
+
     class Meta:
         model = Comment
         fields = ["id", "member", "body", "created_on"]
 
 
+class PostListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        posts = list(iterable)
+
+        # 사용자가 관심을 누른 게시글을 한번에 조회한다.
+        member = self.context["request"].user
+        if not isinstance(member, AnonymousUser):
+            self.context["tabbed_post_ids"] = set(
+                Attention.objects.filter(
+                    member=member, is_deleted=False, post__in=posts
+                ).values_list("post_id", flat=True)
+            )
+
+        return super().to_representation(posts)
+
+
 class PostShortInfoSerializer(serializers.ModelSerializer):
     member = MemberSerializer(read_only=True)
     is_tabbed = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
     address = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.prefetch_related("images", member_prefetch())
+
     def get_is_tabbed(self, obj: Post):
         member = self.context["request"].user
         if isinstance(member, AnonymousUser):
             return False
+
+        tabbed_post_ids = self.context.get("tabbed_post_ids", None)
+        if tabbed_post_ids is not None:
+            return obj.id in tabbed_post_ids
         return obj.attentions.filter(member=member, is_deleted=False).exists()
 
     def get_images(self, obj: Post):
@@ -120,16 +137,7 @@ class PostShortInfoSerializer(serializers.ModelSerializer):
     def get_address(self, obj: Post):
         if obj.address:
             return obj.address
-        if not obj.longitude or not obj.latitude:
-            return _("부정확한 주소")
-
-        address = coord_to_region(float(obj.longitude), float(obj.latitude))
-        if not address:
-            return _("부정확한 주소")
-
-        obj.address = address
-        obj.save()
-        return obj.address
+        return _("부정확한 주소")
 
     class Meta:
         model = Post
@@ -144,6 +152,7 @@ class PostShortInfoSerializer(serializers.ModelSerializer):
             "is_tabbed",
             "created_on",
         ]
+        list_serializer_class = PostListSerializer
 
 
 class PostDetailInfoSerializer(PostShortInfoSerializer):
@@ -151,7 +160,10 @@ class PostDetailInfoSerializer(PostShortInfoSerializer):
 
     def get_comments(self, obj: Post):
         return CommentInfoSerializer(
-            obj.comments.filter(is_deleted=False), many=True
+            CommentInfoSerializer.setup_eager_loading(
+                obj.comments.filter(is_deleted=False)
+            ),
+            many=True,
         ).data
 
     class Meta:
@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from ggongsul.common.counters import counted_post_delete, counted_pre_delete
+
+from .models import Attention, Comment, Post
+from .tasks import update_post_address
+
+
+@receiver(post_save, sender=Post)
+def enqueue_post_address(sender, instance, created, **kwargs):
+    if created and not instance.address:
+        transaction.on_commit(lambda: update_post_address.delay(instance.id))
+
+
+# queryset 으로 삭제된 관심, 댓글도 게시글의 카운터에서 뺀다.
+for counted_model in (Comment, Attention):
+    pre_delete.connect(counted_pre_delete, sender=counted_model)
+    post_delete.connect(counted_post_delete, sender=counted_model)
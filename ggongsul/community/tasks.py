@@ -0,0 +1,58 @@
+import logging
+
+from typing import Optional
+
+from celery import shared_task
+from django.db.models import Q
+from requests import RequestException
+
+from ggongsul.common.geocode import cached_coord_to_region
+from ggongsul.community.models import Post
+from ggongsul.core.exceptions import BadResponse
+
+logger = logging.getLogger(__name__)
+
+INACCURATE_ADDRESS = "부정확한 주소"
+
+
+def coord_to_region(lng: float, lat: float) -> Optional[str]:
+    try:
+        res = cached_coord_to_region(lng=lng, lat=lat)
+    except BadResponse as e:
+        # 잘못된 좌표는 다시 시도해도 결과가 같다.
+        if e.status_code == -2:
+            return INACCURATE_ADDRESS
+        raise
+
+    docs = res.get("documents", [])
+    if docs:
+        return docs[0]["address_name"]
+
+    return None
+
+
+@shared_task(bind=True, max_retries=5)
+def update_post_address(self, post_id: int):
+    post = (
+        Post.objects.filter(id=post_id)
+        .only("id", "address", "longitude", "latitude")
+        .first()
+    )
+    if post is None or post.address:
+        return
+    if post.longitude is None or post.latitude is None:
+        return
+
+    try:
+        address = coord_to_region(float(post.longitude), float(post.latitude))
+    except (BadResponse, RequestException) as e:
+        raise self.retry(exc=e, countdown=2 ** self.request.retries)
+
+    if not address:
+        logger.warning(f"can not find the address of post {post_id}")
+        return
+
+    # updated_on 을 갱신하지 않도록 update 로 저장한다.
+    Post.objects.filter(Q(address__isnull=True) | Q(address=""), id=post_id).update(
+        address=address
+    )
@@ -0,0 +1,393 @@
+import math
+
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from ggongsul.common.geo import (
+    EARTH_RADIUS_KM,
+    bounding_box,
+    haversine,
+    haversine_expression,
+)
+from ggongsul.core.filters import DistanceFilterBackend
+from ggongsul.member.models import Member
+from ggongsul.membership.models import Membership, Subscription
+
+from .models import Attention, Comment, Post, PostImage
+from .projections import FEED_ROW_FIELDS, feed_rows
+from .serializers import PostShortInfoSerializer
+
+
+def create_posts(member_cnt: int, post_cnt: int):
+    members = []
+    for i in range(member_cnt):
+        member = Member.objects.create_user(username=f"member{i}", password="pw")
+        Membership.objects.create(
+            member=member, is_active=True, last_activated_at=timezone.now()
+        )
+        Subscription.create_subscription(member=member, started_at=timezone.now())
+        members.append(member)
+
+        for j in range(post_cnt):
+            post = Post.objects.create(
+                member=member,
+                body=f"본문 {j}",
+                latitude=37.5,
+                longitude=127.0,
+                address="서울",
+            )
+            PostImage.objects.create(post=post, image=f"image/post/{i}-{j}.jpg")
+            Attention.objects.create(post=post, member=members[0])
+    return members
+
+
+class PostQueryCountTest(APITestCase):
+    """
+    The number of queries of the feed should not grow with the number of
+    posts or authors.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_posts(member_cnt=3, post_cnt=3)
+
+    def test_list(self):
+        self.client.force_authenticate(self.members[0])
+        # 전체 수, 게시글, 사진, 관심 여부, 작성자, 작성자의 구독 정보
+        with self.assertNumQueries(6):
+            resp = self.client.get("/api/v1/posts/?lat=37.5&lng=127.0")
+        self.assertEqual(resp.json()["count"], 9)
+        self.assertTrue(all(post["is_tabbed"] for post in resp.json()["results"]))
+
+    def test_list_anonymous(self):
+        with self.assertNumQueries(5):
+            resp = self.client.get("/api/v1/posts/?lat=37.5&lng=127.0")
+        self.assertEqual(len(resp.json()["results"]), 9)
+
+    def test_cursor_list(self):
+        self.client.force_authenticate(self.members[0])
+        with self.assertNumQueries(5):
+            resp = self.client.get(
+                "/api/v1/posts/?lat=37.5&lng=127.0&pagination=cursor"
+            )
+        self.assertEqual(len(resp.json()["results"]), 9)
+
+
+class PostCursorPaginationTest(APITestCase):
+    """
+    Cursor pages should follow the requested ordering.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_posts(member_cnt=2, post_cnt=3)
+        for i, post in enumerate(Post.objects.order_by("id")):
+            Post.objects.filter(id=post.id).update(
+                attention_count=i % 3, comment_count=i % 2
+            )
+
+    def fetch_all(self, ordering: str) -> list:
+        ids = []
+        url = (
+            "/api/v1/posts/?lat=37.5&lng=127.0&pagination=cursor&page_size=2"
+            f"&ordering={ordering}"
+        )
+        while url:
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200)
+            ids += [post["id"] for post in resp.json()["results"]]
+            url = resp.json()["next"]
+        return ids
+
+    def test_ordering(self):
+        for ordering in ("-attention_count", "comment_count", "-created_on"):
+            field = ordering.lstrip("-")
+            # 값이 같은 게시글은 정렬 방향대로 id 순으로 나온다.
+            posts = sorted(
+                Post.objects.all(),
+                key=lambda post: (getattr(post, field), post.id),
+                reverse=ordering.startswith("-"),
+            )
+            self.assertEqual(self.fetch_all(ordering), [post.id for post in posts])
+
+    def test_deep_page_queries(self):
+        for ordering in ("-created_on", "distance"):
+            url = (
+                "/api/v1/posts/?lat=37.5&lng=127.0&pagination=cursor&page_size=1"
+                f"&ordering={ordering}"
+            )
+            for _ in range(Post.objects.count() - 1):
+                url = self.client.get(url).json()["next"]
+
+            # 마지막 페이지도 앞의 row 를 건너뛰거나 전체 수를 세지 않는다.
+            with CaptureQueriesContext(connection) as queries:
+                resp = self.client.get(url)
+            self.assertEqual(len(resp.json()["results"]), 1)
+            self.assertIsNone(resp.json()["next"])
+
+            # 작성자 정보 등을 제외한 게시글 조회는 한 번뿐이다.
+            (sql,) = [
+                query["sql"].upper()
+                for query in queries
+                if 'FROM "COMMUNITY_POST"' in query["sql"].upper()
+            ]
+            self.assertNotIn("OFFSET", sql, ordering)
+            self.assertNotIn("COUNT(", sql, ordering)
+            self.assertIn("LIMIT 2", sql, ordering)
+
+    def test_cursor_of_other_ordering(self):
+        resp = self.client.get(
+            "/api/v1/posts/?lat=37.5&lng=127.0&pagination=cursor&page_size=2"
+        )
+        cursor = resp.json()["next"].split("cursor=")[1].split("&")[0]
+        resp = self.client.get(
+            "/api/v1/posts/?lat=37.5&lng=127.0&pagination=cursor"
+            "&ordering=-attention_count"
+            f"&cursor={cursor}"
+        )
+        self.assertEqual(resp.status_code, 404)
+
+
+def destination(lat: float, lng: float, bearing: float, num_km: float):
+    """
+    Returns the point num_km away from (lat, lng) towards bearing degrees.
+    """
+    lat, lng, bearing = map(math.radians, (lat, lng, bearing))
+    d = num_km / EARTH_RADIUS_KM
+
+    lat2 = math.asin(
+        math.sin(lat) * math.cos(d) + math.cos(lat) * math.sin(d) * math.cos(bearing)
+    )
+    lng2 = lng + math.atan2(
+        math.sin(bearing) * math.sin(d) * math.cos(lat),
+        math.cos(d) - math.sin(lat) * math.sin(lat2),
+    )
+    return round(math.degrees(lat2), 6), round(math.degrees(lng2), 6)
+
+
+class DistanceFilterTest(APITestCase):
+    """
+    The bounding box prefilter should only drop rows which are farther than
+    the distance anyway.
+    """
+
+    LAT, LNG = 37.5, 127.0
+
+    @classmethod
+    def setUpTestData(cls):
+        member = Member.objects.create_user(username="member", password="pw")
+        # 정방향 외에 box 모서리 쪽(45도)의 원 밖 게시글도 만든다.
+        for bearing in range(0, 360, 45):
+            for num_km in (1, 4.9, 5.1, 6.5, 50):
+                lat, lng = destination(cls.LAT, cls.LNG, bearing, num_km)
+                Post.objects.create(
+                    member=member, body="본문", latitude=lat, longitude=lng
+                )
+
+    def filter_queryset(self, queryset):
+        request = Request(
+            APIRequestFactory().get("/", {"lat": self.LAT, "lng": self.LNG})
+        )
+        view = mock.Mock(distance_num_km=5)
+        return DistanceFilterBackend().filter_queryset(request, queryset, view)
+
+    def test_same_as_without_box(self):
+        posts = list(self.filter_queryset(Post.objects.all()))
+        without_box = list(
+            Post.objects.annotate(distance=haversine_expression(self.LAT, self.LNG))
+            .filter(distance__lt=5)
+            .order_by("distance")
+        )
+
+        self.assertEqual(len(posts), 16)
+        self.assertEqual(
+            [post.distance for post in posts], [post.distance for post in without_box]
+        )
+        # 거리가 같은 게시글끼리는 순서가 정해져 있지 않다.
+        self.assertEqual(
+            sorted((post.distance, post.id) for post in posts),
+            sorted((post.distance, post.id) for post in without_box),
+        )
+        for post in posts:
+            self.assertAlmostEqual(
+                post.distance,
+                haversine(
+                    self.LAT, self.LNG, float(post.latitude), float(post.longitude)
+                ),
+            )
+
+    def test_box_candidate_count(self):
+        min_lat, max_lat, min_lng, max_lng = bounding_box(self.LAT, self.LNG, 5)
+        candidates = Post.objects.filter(
+            latitude__range=(min_lat, max_lat), longitude__range=(min_lng, max_lng)
+        )
+        # 원 안의 16개와 box 모서리 쪽(45도)의 5.1, 6.5km 게시글만 거리를 계산한다.
+        self.assertEqual(Post.objects.count(), 40)
+        self.assertEqual(candidates.count(), 24)
+        self.assertEqual(self.filter_queryset(Post.objects.all()).count(), 16)
+
+    def test_box_contains_circle(self):
+        for lat in (0, 37.5, 80):
+            min_lat, max_lat, min_lng, max_lng = bounding_box(lat, self.LNG, 5)
+            for bearing in range(0, 360, 5):
+                p_lat, p_lng = destination(lat, self.LNG, bearing, 4.999)
+                self.assertTrue(min_lat <= p_lat <= max_lat, (lat, bearing))
+                self.assertTrue(min_lng <= p_lng <= max_lng, (lat, bearing))
+
+
+class FeedRowsTest(APITestCase):
+    """
+    Feed rows built from values() should be the same as the serializer
+    output.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_posts(member_cnt=2, post_cnt=2)
+        # 주소, 사진, 관심이 없는 게시글
+        Post.objects.create(
+            member=cls.members[1], body="본문", latitude=37.5, longitude=127.0
+        )
+
+    def assertSameAsSerializer(self, user):
+        request = Request(APIRequestFactory().get("/"))
+        request.user = user
+
+        queryset = Post.objects.order_by("-created_on", "-id")
+        rows = feed_rows(list(queryset.values(*FEED_ROW_FIELDS)), user)
+        serializer = PostShortInfoSerializer(
+            PostShortInfoSerializer.setup_eager_loading(queryset),
+            many=True,
+            context={"request": request},
+        )
+        self.assertEqual(rows, serializer.data)
+
+    def test_feed_rows(self):
+        self.assertSameAsSerializer(self.members[0])
+
+    def test_feed_rows_anonymous(self):
+        self.assertSameAsSerializer(AnonymousUser())
+
+
+class PostCounterTest(APITestCase):
+    """
+    attention_count and comment_count should follow the undeleted
+    attentions and comments of the post.
+    """
+
+    def setUp(self):
+        self.member = Member.objects.create_user(username="member", password="pw")
+        self.post = Post.objects.create(member=self.member, body="본문")
+
+    def assertCounts(self, attention_count: int, comment_count: int):
+        post = Post.objects.get(id=self.post.id)
+        self.assertEqual(
+            (post.attention_count, post.comment_count),
+            (attention_count, comment_count),
+        )
+
+    def create_comments(self, cnt: int):
+        return [
+            Comment.objects.create(post=self.post, member=self.member, body="댓글")
+            for _ in range(cnt)
+        ]
+
+    def test_comment(self):
+        first, second = self.create_comments(2)
+        self.assertCounts(0, 2)
+
+        first.is_deleted = True
+        first.save()
+        self.assertCounts(0, 1)
+        # 삭제된 댓글을 다시 저장해도 카운터는 그대로다.
+        first.save()
+        self.assertCounts(0, 1)
+
+        second.delete()
+        self.assertCounts(0, 0)
+
+    def test_save_without_counted_fields(self):
+        comment = self.create_comments(1)[0]
+        comment.is_deleted = True
+        comment.save(update_fields=["body"])
+        self.assertCounts(0, 1)
+
+    def test_stale_copies(self):
+        Attention.objects.create(post=self.post, member=self.member)
+        first, second = Attention.objects.get(), Attention.objects.get()
+
+        first.is_deleted = second.is_deleted = True
+        first.save()
+        second.save()
+        self.assertCounts(0, 0)
+
+        first.is_deleted = second.is_deleted = False
+        first.save()
+        second.save()
+        self.assertCounts(1, 0)
+
+    def test_stale_delete(self):
+        self.create_comments(1)
+        first, second = Comment.objects.get(), Comment.objects.get()
+
+        first.delete()
+        second.delete()
+        self.assertCounts(0, 0)
+
+    def test_queryset_delete(self):
+        self.create_comments(3)[0].delete()
+        Comment.objects.filter(post=self.post).delete()
+        self.assertCounts(0, 0)
+
+    def test_tab_attention(self):
+        self.client.force_authenticate(self.member)
+        url = f"/api/v1/posts/{self.post.id}/tab/"
+
+        self.client.post(url)
+        self.assertCounts(1, 0)
+        self.client.post(url)
+        self.assertCounts(0, 0)
+        self.client.post(url)
+        self.assertCounts(1, 0)
+
+    def test_reconcile(self):
+        self.create_comments(2)
+        Post.objects.filter(id=self.post.id).update(attention_count=3, comment_count=0)
+
+        call_command("reconcile_post_counters", stdout=mock.MagicMock())
+        self.assertCounts(0, 2)
+
+
+@mock.patch("ggongsul.community.tasks.cached_coord_to_region")
+class BackfillPostAddressTest(APITestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username="member", password="pw")
+
+    def create_post(self, **kwargs) -> Post:
+        return Post.objects.create(member=self.member, body="본문", **kwargs)
+
+    def test_backfill(self, coord_to_region):
+        coord_to_region.return_value = {"documents": [{"address_name": "서울"}]}
+        without_address = self.create_post(latitude=37.5, longitude=127.0)
+        empty_address = self.create_post(latitude=37.5, longitude=127.0, address="")
+        with_address = self.create_post(latitude=37.5, longitude=127.0, address="부산")
+        without_coord = self.create_post()
+
+        call_command("backfill_post_address", "--sync", stdout=mock.MagicMock())
+        self.assertEqual(coord_to_region.call_count, 2)
+        self.assertEqual(
+            dict(Post.objects.values_list("id", "address")),
+            {
+                without_address.id: "서울",
+                empty_address.id: "서울",
+                with_address.id: "부산",
+                without_coord.id: None,
+            },
+        )
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.utils import timezone
 
 from rest_framework import status
@@ -10,6 +11,7 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework.serializers import Serializer
 
 from ggongsul.community.models import Post, Comment, Attention
+from ggongsul.community.projections import FEED_ROW_FIELDS, feed_rows
 from ggongsul.community.serializers import (
     PostShortInfoSerializer,
     PostDetailInfoSerializer,
@@ -19,14 +21,15 @@ from ggongsul.community.serializers import (
     PostImageSerializer,
 )
 from ggongsul.core.filters import DistanceFilterBackend, PostFilterBackend
-from ggongsul.core.paginations import SmallResultsSetPagination
+from ggongsul.core.paginations import CursorOptInPagination
 from ggongsul.core.permissions import IsObjectOwnerMember
 
 
 class PostViewSet(ModelViewSet):
     queryset = Post.objects.filter(is_deleted=False)
-    pagination_class = SmallResultsSetPagination
+    pagination_class = CursorOptInPagination
     ordering = ("-created_on",)
+    ordering_fields = ("created_on", "attention_count", "comment_count", "distance")
 
     @property
     def filter_backends(self):
@@ -42,6 +45,13 @@ class PostViewSet(ModelViewSet):
             return [IsObjectOwnerMember]
         return [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # 목록은 values() 로 조회하므로 연관 정보를 미리 불러오지 않는다.
+        if self.action == "retrieve":
+            queryset = self.get_serializer_class().setup_eager_loading(queryset)
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "list":
             return PostShortInfoSerializer
@@ -53,6 +63,20 @@ class PostViewSet(ModelViewSet):
             return PostImageSerializer
         return PostSerializer
 
+    def list(self, request: Request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        fields = FEED_ROW_FIELDS
+        # 거리 cursor 는 row 의 distance 를 사용한다.
+        if "distance" in queryset.query.annotations:
+            fields += ("distance",)
+        rows = queryset.values(*fields)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(feed_rows(page, request.user))
+        return Response(feed_rows(list(rows), request.user))
+
     def perform_destroy(self, instance: Post):
         cur_datetime = timezone.now()
         instance.is_deleted = True
@@ -64,11 +88,16 @@ class PostViewSet(ModelViewSet):
         post: Post = self.get_object()
         member = request.user
 
-        attention, created = Attention.objects.get_or_create(post=post, member=member)
-        if not created:
-            # true if false, false if true
-            attention.is_deleted = not (attention.is_deleted or False)
-            attention.save()
+        with transaction.atomic():
+            attention, created = Attention.objects.get_or_create(
+                post=post, member=member
+            )
+            if not created:
+                # 동시에 누른 요청이 같은 상태를 보고 뒤집지 않도록 row 를 잠근다.
+                attention = Attention.objects.select_for_update().get(pk=attention.pk)
+                # true if false, false if true
+                attention.is_deleted = not (attention.is_deleted or False)
+                attention.save()
 
         return Response(status=status.HTTP_200_OK)
 
@@ -88,6 +117,12 @@ class CommentViewSet(ModelViewSet):
             return [IsObjectOwnerMember]
         return [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve"]:
+            queryset = CommentInfoSerializer.setup_eager_loading(queryset)
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ["list", "retrieve"]:
             return CommentInfoSerializer
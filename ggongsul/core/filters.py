@@ -1,9 +1,7 @@
-from django.db.models import F
-from django.db.models.functions import Radians, Power, Sin, Cos, ATan2, Sqrt
 from rest_framework import filters
-from rest_framework.exceptions import ValidationError
 
-from ggongsul.core.validators import validate_dict_key
+from ggongsul.common.geo import haversine_expression, bounding_box
+from ggongsul.core.validators import validate_lat_lng
 
 
 class MemberFilterBackend(filters.BaseFilterBackend):
@@ -24,33 +22,18 @@ class PostFilterBackend(filters.BaseFilterBackend):
 
 class DistanceFilterBackend(filters.BaseFilterBackend):
     def filter_queryset(self, request, queryset, view):
-        lat, lng = validate_dict_key(request.query_params, ["lat", "lng"])
-
-        if (
-            not lat.replace(".", "", 1).isnumeric()
-            or not lng.replace(".", "", 1).isnumeric()
-        ):
-            raise ValidationError(
-                {"msg": "'lat' and 'lng' query params should be float!"}
-            )
-
-        lat = float(lat)
-        lng = float(lng)
-
+        lat, lng = validate_lat_lng(request.query_params)
         num_km = getattr(view, "distance_num_km", 5)
 
-        dlat = Radians(F("latitude") - lat)
-        dlong = Radians(F("longitude") - lng)
-
-        a = Power(Sin(dlat / 2), 2) + Cos(Radians(lat)) * Cos(
-            Radians(F("latitude"))
-        ) * Power(Sin(dlong / 2), 2)
-
-        c = 2 * ATan2(Sqrt(a), Sqrt(1 - a))
-        d = 6371 * c
+        # 인덱스를 탈 수 있는 bounding box 로 후보를 먼저 거른 후 정확한 거리를 계산한다.
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, num_km)
 
         return (
-            queryset.annotate(distance=d)
+            queryset.filter(
+                latitude__range=(min_lat, max_lat),
+                longitude__range=(min_lng, max_lng),
+            )
+            .annotate(distance=haversine_expression(lat, lng))
             .order_by("distance")
             .filter(distance__lt=num_km)
         )
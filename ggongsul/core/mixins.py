@@ -0,0 +1,200 @@
+import hashlib
+import json
+import logging
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from django.core.cache import caches
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_VERSION_KEY = "response.version:{}"
+RESPONSE_CACHE_KEY = "response:{}"
+
+
+def get_response_version(name: str) -> Optional[int]:
+    """
+    Returns the version of the responses which depend on `name`, None if
+    the shared cache can not be read.
+    """
+    try:
+        return caches["shared"].get(RESPONSE_VERSION_KEY.format(name), 0)
+    except Exception:
+        # shared 캐시 장애가 요청 실패로 이어지지 않도록 한다.
+        logger.warning(f"failed to read response version of {name}")
+        return None
+
+
+def bump_response_version(name: str):
+    """
+    Changes the ETag of every response which depends on `name`, which also
+    drops their cached bodies.
+    """
+    cache = caches["shared"]
+    key = RESPONSE_VERSION_KEY.format(name)
+    try:
+        # incr 는 키가 없으면 실패하므로 먼저 만들어 둔다.
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except Exception:
+        logger.warning(f"failed to bump response version of {name}")
+
+
+def to_timestamp(value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    return int(timezone.make_aware(value).timestamp())
+
+
+class ConditionalGetMixin:
+    """
+    Answers list and retrieve with a strong ETag and Last-Modified derived
+    from the `updated_on` of the rows, so that revalidating an unchanged
+    resource gets 304 without serializing anything.
+    """
+
+    conditional_actions = ("list", "retrieve")
+    last_modified_fields: Tuple[str, ...] = ("updated_on",)
+    # action 별 Cache-Control 값, patch_cache_control 의 인자로 사용된다.
+    cache_control: Dict[str, dict] = {}
+    # updated_on 에 드러나지 않는 변경(ex. 연관 모델)은 signal 에서 version 을 올린다.
+    response_version_name: Optional[str] = None
+    response_cache_timeout: Optional[int] = None
+
+    def get_modified_state(self) -> Tuple[Optional[datetime], int]:
+        """
+        Returns the latest `updated_on` and the count of the rows which the
+        response is made of.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+
+        state = queryset.aggregate(
+            cnt=Count("pk"),
+            **{
+                f"last_{i}": Max(field)
+                for i, field in enumerate(self.last_modified_fields)
+            },
+        )
+        cnt = state.pop("cnt")
+        modified = [value for value in state.values() if value is not None]
+        return max(modified, default=None), cnt
+
+    def get_etag(
+        self, last_modified: Optional[datetime], cnt: int, version: int = None
+    ) -> str:
+        request = self.request
+        key = [
+            type(self).__name__,
+            self.action,
+            request.get_full_path(),
+            request.accepted_media_type,
+            cnt,
+            last_modified.isoformat() if last_modified else None,
+        ]
+        if version is not None:
+            key.append(version)
+        return hashlib.sha1(json.dumps(key).encode()).hexdigest()
+
+    def conditional_response(self, handler, request: Request, *args, **kwargs):
+        # 사용자마다 내용이 달라지는 browsable api 는 그대로 응답한다.
+        if (
+            self.action not in self.conditional_actions
+            or request.accepted_renderer.format != "json"
+        ):
+            return handler(request, *args, **kwargs)
+
+        version = None
+        if self.response_version_name:
+            version = get_response_version(self.response_version_name)
+            # version 을 모르면 변경 여부를 알 수 없으므로 ETag, 캐시 없이 응답한다.
+            if version is None:
+                return handler(request, *args, **kwargs)
+
+        last_modified, cnt = self.get_modified_state()
+        if self.action == "retrieve" and not cnt:
+            return handler(request, *args, **kwargs)
+
+        etag = self.get_etag(last_modified, cnt, version)
+        timestamp = to_timestamp(last_modified)
+
+        response = self.get_not_modified_response(request, etag, timestamp)
+        if response is None:
+            response = self.get_cached_response(handler, etag, request, *args, **kwargs)
+
+        self.add_conditional_headers(response, etag, timestamp)
+        return response
+
+    def get_not_modified_response(
+        self, request: Request, etag: str, timestamp: Optional[int]
+    ) -> Optional[HttpResponse]:
+        return get_conditional_response(
+            request, etag=quote_etag(etag), last_modified=timestamp
+        )
+
+    def add_conditional_headers(
+        self, response: HttpResponse, etag: str, timestamp: Optional[int]
+    ):
+        response["ETag"] = quote_etag(etag)
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        patch_cache_control(response, **self.cache_control.get(self.action, {}))
+        patch_vary_headers(response, ["Accept"])
+
+    def get_cached_response(
+        self, handler, etag: str, request: Request, *args, **kwargs
+    ):
+        if not self.response_cache_timeout:
+            return handler(request, *args, **kwargs)
+
+        cache = caches["shared"]
+        key = RESPONSE_CACHE_KEY.format(etag)
+        try:
+            cached = cache.get(key)
+        except Exception:
+            logger.warning(f"failed to read cached response of {type(self).__name__}")
+            cached = None
+        if cached is not None:
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        def store(r: HttpResponse):
+            try:
+                cache.set(
+                    key, (r.content, r["Content-Type"]), self.response_cache_timeout
+                )
+            except Exception:
+                logger.warning(f"failed to cache response of {type(self).__name__}")
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+
+        if isinstance(response, Response):
+            # 본문은 finalize_response 이후에 렌더링되므로 그 때 저장한다.
+            response.add_post_render_callback(store)
+        else:
+            store(response)
+        return response
+
+    def list(self, request: Request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
@@ -1,4 +1,25 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import DateTimeField, Q
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from ggongsul.core.validators import validate_lat_lng
 
 
 class LargeResultsSetPagination(PageNumberPagination):
@@ -17,3 +38,318 @@ class SmallResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only cursor pagination over a unique ordering.
+
+    Unlike CursorPagination, the cursor keeps the values of every ordering
+    field of the last row, so the next page is fetched with a tuple
+    comparison instead of an OFFSET and no COUNT(*) is executed.
+
+    The keyset follows the ordering of the queryset (e.g. by OrderingFilter)
+    with id appended as the tie-breaker, and falls back to `ordering` when
+    the queryset is not ordered explicitly.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Invalid cursor")
+
+    # 마지막 필드는 row 를 유일하게 구분해야 한다.
+    ordering: Tuple[str, ...] = ("-created_on", "-id")
+    invalid_ordering_message = "ordering is not supported with cursor pagination!"
+
+    def get_ordering(self, queryset) -> Tuple[str, ...]:
+        requested = queryset.query.order_by
+        if not requested:
+            return self.ordering
+
+        ordering = []
+        for field in requested:
+            # cursor 에는 row 의 값만 담을 수 있으므로 expression, 연관 필드 정렬은 지원하지 않는다.
+            if not isinstance(field, str) or field == "?" or "__" in field:
+                raise ValidationError({"msg": self.invalid_ordering_message})
+            ordering.append(field)
+            if field.lstrip("-") == "id":
+                return tuple(ordering)
+        # 같은 값을 가진 row 는 정렬의 마지막 방향대로 id 로 구분한다.
+        tie_breaker = "-id" if ordering and ordering[-1].startswith("-") else "id"
+        return tuple(ordering) + (tie_breaker,)
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def encode_value(self, field: str, value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def is_datetime_field(self, name: str) -> bool:
+        try:
+            return isinstance(self.model._meta.get_field(name), DateTimeField)
+        except FieldDoesNotExist:
+            return False
+
+    def decode_value(self, field: str, value):
+        if self.is_datetime_field(field.lstrip("-")):
+            parsed = parse_datetime(value)
+            if parsed is None:
+                raise ValueError(value)
+            return parsed
+        return value
+
+    def get_field_value(self, instance, name: str):
+        # values() 로 조회된 row 도 페이지를 나눌 수 있도록 한다.
+        if isinstance(instance, dict):
+            return instance[name]
+        return getattr(instance, name)
+
+    def get_cursor_data(self, instance) -> dict:
+        return {
+            "v": [
+                self.encode_value(
+                    field, self.get_field_value(instance, field.lstrip("-"))
+                )
+                for field in self.ordering
+            ],
+            "k": list(self.ordering),
+        }
+
+    def encode_cursor(self, data: dict) -> str:
+        data = json.dumps(data, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(data.encode("ascii")).decode("ascii")
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
+
+    def decode_cursor(self, request: Request) -> Optional[dict]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            values = data["v"]
+            # 다른 정렬로 만들어진 cursor 는 사용할 수 없다.
+            if data.get("k") != list(self.ordering):
+                raise ValueError(values)
+            data["v"] = [
+                self.decode_value(field, value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return data
+
+    def get_keyset_filter(self, values: list) -> Q:
+        """
+        Returns the condition of rows after `values` in the ordering, e.g.
+        (a < va) OR (a = va AND b < vb) for ("-a", "-b").
+        """
+        condition = Q()
+        equals = {}
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equals, **{f"{name}__{lookup}": value})
+            equals[name] = value
+        return condition
+
+    def filter_after_cursor(self, queryset, cursor: dict):
+        return queryset.filter(self.get_keyset_filter(cursor["v"]))
+
+    def paginate_queryset(self, queryset, request: Request, view=None):
+        self.request = request
+        self.model = queryset.model
+        self.ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = self.filter_after_cursor(queryset, cursor)
+
+        # 다음 페이지 존재 여부를 알기 위해 한 개를 더 조회한다.
+        results = list(queryset[: page_size + 1])
+        self.page = results[:page_size]
+        self.has_next = len(results) > page_size
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.get_cursor_data(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", None),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "previous": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
+
+
+class DistanceKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination over the `distance` annotated by DistanceFilterBackend.
+
+    The cursor keeps the origin and the last (distance, id), so the next
+    page only reads rows beyond that ring from the same origin.
+    """
+
+    ordering = ("distance", "id")
+
+    def get_ordering(self, queryset) -> Tuple[str, ...]:
+        return self.ordering
+
+    def get_origin(self, request: Request) -> Tuple[float, float]:
+        return validate_lat_lng(request.query_params)
+
+    def decode_value(self, field: str, value):
+        if field == "distance":
+            return float(value)
+        return int(value)
+
+    def get_cursor_data(self, instance) -> dict:
+        # 메모리 index 의 결과는 (distance, point) 로 전달된다.
+        if isinstance(instance, tuple):
+            distance, point = instance
+            values = [distance, point.id]
+        else:
+            values = [
+                self.get_field_value(instance, "distance"),
+                self.get_field_value(instance, "id"),
+            ]
+        return {
+            "v": values,
+            "k": list(self.ordering),
+            "o": list(self.get_origin(self.request)),
+        }
+
+    def decode_cursor(self, request: Request) -> Optional[dict]:
+        cursor = super().decode_cursor(request)
+        if cursor is None:
+            return None
+
+        # 다른 위치에서 만들어진 cursor 의 거리는 의미가 없다.
+        if cursor.get("o") != list(self.get_origin(request)):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def paginate_sorted(self, found: List[tuple], request: Request) -> List[tuple]:
+        """
+        Paginates (distance, point) pairs already sorted by distance and id.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            after = tuple(cursor["v"])
+            found = [pair for pair in found if (pair[0], pair[1].id) > after]
+
+        self.page = found[:page_size]
+        self.has_next = len(found) > page_size
+        return self.page
+
+
+class CursorOptInPagination(BasePagination):
+    """
+    Page number pagination, or keyset pagination when requested with
+    `?pagination=cursor` so that old clients keep working.
+    """
+
+    mode_query_param = "pagination"
+    page_number_class = SmallResultsSetPagination
+    cursor_class = KeysetPagination
+    distance_cursor_class = DistanceKeysetPagination
+
+    def is_cursor_mode(self, request: Request) -> bool:
+        return request.query_params.get(self.mode_query_param) == "cursor"
+
+    def get_cursor_paginator(self, request: Request, view=None) -> KeysetPagination:
+        # 거리순으로 정렬된 결과는 거리 기준으로 cursor 를 만든다.
+        if request.query_params.get("ordering") == "distance":
+            return self.distance_cursor_class()
+        return self.cursor_class()
+
+    def paginate_queryset(self, queryset, request: Request, view=None):
+        if self.is_cursor_mode(request):
+            self.paginator = self.get_cursor_paginator(request, view)
+        elif self.page_number_class:
+            self.paginator = self.page_number_class()
+        else:
+            return None
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def paginate_sorted(self, found: List[tuple], request: Request, view=None):
+        """
+        Paginates (distance, point) pairs of the in-memory partner index.
+        """
+        if not self.is_cursor_mode(request):
+            return None
+        self.paginator = self.distance_cursor_class()
+        return self.paginator.paginate_sorted(found, request)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        if not self.page_number_class:
+            return schema
+        return self.page_number_class().get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = []
+        if self.page_number_class:
+            parameters = self.page_number_class().get_schema_operation_parameters(view)
+        return parameters + [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "cursor 이면 cursor 기반으로 페이지를 나눕니다.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": KeysetPagination.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "cursor value",
+                "schema": {"type": "string"},
+            },
+        ]
+
+
+class NearCursorOptInPagination(CursorOptInPagination):
+    """
+    Distance keyset pagination for the nearby lookups, which are not
+    paginated unless `?pagination=cursor` is given.
+    """
+
+    page_number_class = None
+    cursor_class = DistanceKeysetPagination
@@ -0,0 +1,55 @@
+import decimal
+
+from datetime import datetime
+from typing import Callable, Optional
+
+from django.db import models
+
+# serializer 를 거치지 않는 values() 조회 결과를 DRF field 와 같은 값으로 변환한다.
+
+
+def decimal_formatter(
+    field: models.DecimalField,
+) -> Callable[[Optional[decimal.Decimal]], Optional[str]]:
+    """
+    Returns a function formatting values of field like DRF's DecimalField.
+    """
+    quantum = decimal.Decimal(".1") ** field.decimal_places
+    context = decimal.getcontext().copy()
+    context.prec = field.max_digits
+
+    def format_decimal(value) -> Optional[str]:
+        if value is None:
+            return None
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return "{:f}".format(value.quantize(quantum, context=context))
+
+    return format_decimal
+
+
+def file_url_getter(field: models.FileField) -> Callable[[str], str]:
+    """
+    Returns a function building the url of a stored file name of field,
+    like FieldFile.url.
+    """
+    storage = field.storage
+
+    def get_url(name: str) -> str:
+        if not name:
+            raise ValueError(
+                f"The '{field.name}' attribute has no file associated with it."
+            )
+        return storage.url(name)
+
+    return get_url
+
+
+def format_datetime(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
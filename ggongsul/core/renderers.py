@@ -1,7 +1,77 @@
+from decimal import Decimal
+
+import orjson
+
 from django.shortcuts import resolve_url
 from django.template import loader
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
 from rest_framework import serializers
-from rest_framework.renderers import HTMLFormRenderer
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer, HTMLFormRenderer, JSONRenderer
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.mediatypes import _MediaType
+
+_encoder = JSONEncoder()
+
+
+def _orjson_default(obj):
+    # lazy 번역 문자열과 Decimal 좌표는 JSONRenderer 와 같은 값으로 변환한다.
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # 날짜(밀리초 단위로 자름), uuid, queryset 등은 DRF encoder 를 그대로 사용한다.
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSONRenderer compatible renderer which encodes with orjson.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        # orjson 은 indent 를 지원하지 않으므로 보기 좋게 요청된 응답은 JSONRenderer 로 만든다.
+        if accepted_media_type and "indent" in _MediaType(accepted_media_type).params:
+            return JSONRenderer().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=_orjson_default, option=self.options)
+
+
+class ORJSONParser(BaseParser):
+    """
+    Parses JSON-serialized data with orjson.
+    """
+
+    media_type = "application/json"
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+def is_plain_json(request: Request) -> bool:
+    """
+    Whether the response is rendered as compact json, so that pre-rendered
+    bytes can be returned as they are.
+    """
+    renderer = request.accepted_renderer
+    return (
+        renderer.format == "json" and request.accepted_media_type == renderer.media_type
+    )
 
 
 class ImageHTMLFormRenderer(HTMLFormRenderer):
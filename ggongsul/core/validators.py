@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from rest_framework.exceptions import ValidationError
 
@@ -15,3 +15,32 @@ def validate_dict_key(d: dict, keys: List[str]):
         return [d[k] for k in keys]
 
     raise ValidationError(error_msgs)
+
+
+def validate_lat_lng(d: dict) -> Tuple[float, float]:
+    lat, lng = validate_dict_key(d, ["lat", "lng"])
+
+    if (
+        not lat.replace(".", "", 1).isnumeric()
+        or not lng.replace(".", "", 1).isnumeric()
+    ):
+        raise ValidationError({"msg": "'lat' and 'lng' query params should be float!"})
+
+    return float(lat), float(lng)
+
+
+def validate_bbox(d: dict) -> Tuple[float, float, float, float]:
+    """
+    Returns (min_lat, max_lat, min_lng, max_lng) of the bbox query params.
+    """
+    values = validate_dict_key(d, ["min_lat", "max_lat", "min_lng", "max_lng"])
+
+    try:
+        min_lat, max_lat, min_lng, max_lng = [float(v) for v in values]
+    except ValueError:
+        raise ValidationError({"msg": "bbox query params should be float!"})
+
+    if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lng <= max_lng <= 180):
+        raise ValidationError({"msg": "bbox query params are out of range!"})
+
+    return min_lat, max_lat, min_lng, max_lng
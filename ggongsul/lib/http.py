@@ -0,0 +1,75 @@
+import os
+import threading
+
+from typing import Dict, Tuple
+
+import requests
+
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# read 실패/5xx 는 멱등한 요청만 재시도한다. 연결 실패는 요청이 전송되지 않았으므로 항상 재시도된다.
+IDEMPOTENT_METHODS = frozenset(["HEAD", "GET", "PUT", "DELETE", "OPTIONS"])
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter which applies a default timeout to every request.
+    """
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=settings.HTTP_CLIENT_MAX_RETRIES,
+        backoff_factor=settings.HTTP_CLIENT_BACKOFF_FACTOR,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        timeout=settings.HTTP_CLIENT_TIMEOUT,
+        pool_connections=settings.HTTP_CLIENT_POOL_CONNECTIONS,
+        pool_maxsize=settings.HTTP_CLIENT_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_sessions: Dict[str, Tuple[int, requests.Session]] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(name: str) -> requests.Session:
+    """
+    Returns the pooled session of this process for the given api.
+
+    Sessions are shared between threads, so callers must pass per-call
+    headers (e.g. Authorization) with each request instead of mutating
+    session.headers.
+    """
+    pid = os.getpid()
+    item = _sessions.get(name)
+    if item is not None and item[0] == pid:
+        return item[1]
+
+    with _sessions_lock:
+        item = _sessions.get(name)
+        # fork 된 worker 는 부모의 connection 을 공유하지 않도록 새로 만든다.
+        if item is None or item[0] != pid:
+            item = (pid, _build_session())
+            _sessions[name] = item
+        return item[1]
@@ -1,27 +1,42 @@
+import hashlib
+import logging
+import threading
+import time
+
+from typing import Optional, Tuple
+
 import requests
+from django.core.cache import caches
 from rest_framework import status
 
 from ggongsul import settings
 from ggongsul.core import exceptions
+from ggongsul.lib.http import get_session
+
+logger = logging.getLogger(__name__)
+
+# api key 별 (access token, 만료 시각(time.time() 기준))
+_tokens: dict = {}
+_token_lock = threading.Lock()
 
 
 class IMPHelper:
+    TOKEN_URI = "/users/getToken"
+
     _api_key: str
     _api_secret: str
     _session: requests.Session
+    _headers: dict
     _base_url: str
 
     def __init__(self, api_key: str = None, api_secret: str = None):
         self._api_key = api_key if api_key else settings.IMP_REST_API_KEY
         self._api_secret = api_secret if api_secret else settings.IMP_REST_API_SECRET
 
-        self._session = requests.Session()
+        self._session = get_session("iamport")
+        self._headers = {}
         self._base_url = "https://api.iamport.kr"
-        self._update_auth_token()
-
-    def __del__(self):
-        if self._session is not None:
-            self._session.close()
+        self._set_auth_header(self._get_cached_token())
 
     def _request(
         self,
@@ -38,15 +53,16 @@ class IMPHelper:
 
         url = f"{self._base_url}{uri}"
         if method == "get":
-            res = self._session.get(url, data=data, json=json)
+            res = self._session.get(url, data=data, json=json, headers=self._headers)
         elif method == "post":
-            res = self._session.post(url, data=data, json=json)
+            res = self._session.post(url, data=data, json=json, headers=self._headers)
         elif method == "delete":
-            res = self._session.delete(url, data=data, json=json)
+            res = self._session.delete(url, data=data, json=json, headers=self._headers)
         else:
             raise exceptions.CommError("Not allowed Method!")
 
-        if res.status_code == status.HTTP_401_UNAUTHORIZED:
+        # token 발급 요청의 401 은 key 가 잘못된 것이므로 재발급하지 않는다.
+        if res.status_code == status.HTTP_401_UNAUTHORIZED and uri != self.TOKEN_URI:
             self._update_auth_token()
             res = self._request(
                 uri, method, data=data, json=json, retry_cnt=retry_cnt + 1
@@ -67,15 +83,79 @@ class IMPHelper:
             )
         return result.get("response")
 
-    def _get_token(self):
-        uri = "/users/getToken"
+    def _get_token(self) -> Tuple[str, float]:
+        uri = self.TOKEN_URI
         method = "post"
         json = {"imp_key": self._api_key, "imp_secret": self._api_secret}
         resp = self._request(uri, method, json=json)
-        return self._get_imp_response(resp)["access_token"]
+        result = self._get_imp_response(resp)
+
+        # 서버와의 시간 차이에 영향받지 않도록 남은 시간으로 만료 시각을 계산한다.
+        expires_in = result["expired_at"] - result["now"]
+        return result["access_token"], time.time() + expires_in
+
+    @property
+    def _token_cache_key(self) -> str:
+        key_hash = hashlib.sha256(self._api_key.encode("utf-8")).hexdigest()[:16]
+        return f"iamport.token:{key_hash}"
+
+    @staticmethod
+    def _is_usable(token: Optional[Tuple[str, float]]) -> bool:
+        if token is None:
+            return False
+        return token[1] - settings.IMP_TOKEN_REFRESH_MARGIN > time.time()
+
+    def _read_shared_token(self) -> Optional[Tuple[str, float]]:
+        try:
+            token = caches["shared"].get(self._token_cache_key)
+        except Exception:
+            logger.warning("failed to read iamport token from shared cache")
+            return None
+        return tuple(token) if token else None
+
+    def _write_shared_token(self, token: Tuple[str, float]):
+        timeout = int(token[1] - time.time())
+        if timeout <= 0:
+            return
+        try:
+            caches["shared"].set(self._token_cache_key, token, timeout=timeout)
+        except Exception:
+            logger.warning("failed to write iamport token to shared cache")
+
+    def _get_cached_token(self, stale_token: str = None) -> str:
+        """
+        Returns the access token shared by every helper of this process and
+        the other workers, refreshing it shortly before it expires.
+
+        stale_token is the token rejected by iamport, which must not be
+        returned again.
+        """
+
+        def usable(t):
+            return self._is_usable(t) and t[0] != stale_token
+
+        token = _tokens.get(self._api_key)
+        if usable(token):
+            return token[0]
+
+        with _token_lock:
+            token = _tokens.get(self._api_key)
+            if not usable(token):
+                token = self._read_shared_token()
+            if not usable(token):
+                token = self._get_token()
+                self._write_shared_token(token)
+                logger.info("iamport access token is refreshed")
+
+            _tokens[self._api_key] = token
+            return token[0]
+
+    def _set_auth_header(self, access_token: str):
+        self._headers.update({"Authorization": f"Bearer {access_token}"})
 
     def _update_auth_token(self):
-        self._session.headers.update({"Authorization": f"Bearer {self._get_token()}"})
+        stale_token = self._headers.get("Authorization", "")[len("Bearer ") :]
+        self._set_auth_header(self._get_cached_token(stale_token=stale_token))
 
     def get_customer_uid_info(self, customer_uid: str):
         uri = f"/subscribe/customers/{customer_uid}"
@@ -103,6 +183,17 @@ class IMPHelper:
         resp = self._request(uri, method, json=json)
         return self._get_imp_response(resp)
 
+    def find_payment(self, merchant_uid: str) -> Optional[dict]:
+        uri = f"/payments/find/{merchant_uid}"
+        method = "get"
+        try:
+            resp = self._request(uri, method)
+        except exceptions.BadResponse as e:
+            if e.status_code != status.HTTP_404_NOT_FOUND:
+                raise e
+            return None
+        return self._get_imp_response(resp)
+
     def cancel_payment(
         self,
         imp_uid: str,
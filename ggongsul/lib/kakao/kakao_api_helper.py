@@ -4,20 +4,18 @@ from django.conf import settings
 from rest_framework import status
 
 from ggongsul.core import exceptions
+from ggongsul.lib.http import get_session
 
 
 class KakaoApiHelper:
     _api_key: str
     _session: requests.Session
+    _headers: dict
 
     def __init__(self, api_key: str = None):
         self._api_key = api_key if api_key else settings.KAKAO_REST_API_KEY
-        self._session = requests.Session()
-        self._session.headers.update({"Authorization": f"KakaoAK {self._api_key}"})
-
-    def __del__(self):
-        if self._session is not None:
-            self._session.close()
+        self._session = get_session("kakao")
+        self._headers = {"Authorization": f"KakaoAK {self._api_key}"}
 
     def _request(
         self,
@@ -28,9 +26,13 @@ class KakaoApiHelper:
         json: dict = None,
     ) -> dict:
         if method == "get":
-            res = self._session.get(url, params=params, data=data, json=json)
+            res = self._session.get(
+                url, params=params, data=data, json=json, headers=self._headers
+            )
         elif method == "post":
-            res = self._session.post(url, params=params, data=data, json=json)
+            res = self._session.post(
+                url, params=params, data=data, json=json, headers=self._headers
+            )
         else:
             raise exceptions.CommError("Not allowed Method!")
 
@@ -4,6 +4,7 @@ from django.conf import settings
 from rest_framework import status
 
 from ggongsul.core import exceptions
+from ggongsul.lib.http import get_session
 
 
 class KakaoLoginHelper:
@@ -11,6 +12,7 @@ class KakaoLoginHelper:
     _client_secret: str
     _redirect_uri: str
     _session: requests.Session
+    _headers: dict
 
     _access_token: str = None
     _refresh_token: str = None
@@ -33,7 +35,8 @@ class KakaoLoginHelper:
             if redirect_uri
             else getattr(settings, "KAKAO_API_REDIRECT_URI", "")
         )
-        self._session = requests.Session()
+        self._session = get_session("kakao")
+        self._headers = {}
         self._refresh_token = refresh_token
 
         if not access_token:
@@ -43,17 +46,13 @@ class KakaoLoginHelper:
 
         self._update_auth_header()
 
-    def __del__(self):
-        if self._session is not None:
-            self._session.close()
-
     def _request(
         self, url: str, method: str, data: dict = None, json: dict = None
     ) -> dict:
         if method == "get":
-            res = self._session.get(url, data=data, json=json)
+            res = self._session.get(url, data=data, json=json, headers=self._headers)
         elif method == "post":
-            res = self._session.post(url, data=data, json=json)
+            res = self._session.post(url, data=data, json=json, headers=self._headers)
         else:
             raise exceptions.CommError("Not allowed Method!")
 
@@ -75,7 +74,7 @@ class KakaoLoginHelper:
         if not self._access_token:
             raise exceptions.CommError("There is no access token!")
 
-        self._session.headers.update(
+        self._headers.update(
             {
                 "Authorization": "Bearer " + self._access_token,
             }
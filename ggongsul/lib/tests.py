@@ -0,0 +1,68 @@
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from . import http
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def respond(self):
+        self.server.requests.append((self.command, self.client_address))
+        status = self.server.statuses.get(self.path, 200)
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = respond
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(HTTP_CLIENT_MAX_RETRIES=2, HTTP_CLIENT_BACKOFF_FACTOR=0)
+class SessionTest(SimpleTestCase):
+    def setUp(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        server.requests = []
+        server.statuses = {"/unavailable": 503}
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        self.server = server
+        self.url = f"http://127.0.0.1:{server.server_port}"
+        # 다른 테스트의 설정으로 만들어진 session 을 쓰지 않도록 한다.
+        patcher = mock.patch.dict(http._sessions, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuse_session(self):
+        session = http.get_session("stub")
+        self.assertIs(http.get_session("stub"), session)
+        self.assertIsNot(http.get_session("other"), session)
+
+        for _ in range(3):
+            http.get_session("stub").get(f"{self.url}/ok")
+        # 같은 connection 으로 요청된다.
+        self.assertEqual(len({address for _, address in self.server.requests}), 1)
+
+    def test_new_session_after_fork(self):
+        session = http.get_session("stub")
+        with mock.patch("os.getpid", return_value=-1):
+            self.assertIsNot(http.get_session("stub"), session)
+
+    def test_retry_idempotent_method(self):
+        resp = http.get_session("stub").get(f"{self.url}/unavailable")
+        self.assertEqual(resp.status_code, 503)
+        # 처음 요청과 HTTP_CLIENT_MAX_RETRIES 번의 재시도
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_no_retry_post(self):
+        resp = http.get_session("stub").post(f"{self.url}/unavailable")
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual([method for method, _ in self.server.requests], ["POST"])
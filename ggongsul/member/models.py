@@ -3,16 +3,18 @@ from __future__ import annotations
 import os
 import uuid
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import NamedTuple, Tuple, Optional
 
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 from django.db import models
+from django.db.models import Subquery
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from ggongsul.common.counters import RelatedCounter
 from ggongsul.core import exceptions
 from ggongsul.lib.iamport import IMPHelper
 from ggongsul.lib.kakao import KakaoLoginHelper
@@ -31,6 +33,19 @@ class PathAndRename:
         return os.path.join(self.path, renamed_filename)
 
 
+class MembershipState(NamedTuple):
+    is_activated: bool
+    last_activated_at: Optional[datetime]
+    # 가장 최근 구독의 기간
+    started_at: Optional[datetime]
+    ended_at: Optional[datetime]
+
+    def is_subscription_active(self, at: datetime = None) -> bool:
+        if self.ended_at is None:
+            return False
+        return self.ended_at >= (at or timezone.now())
+
+
 class Member(AbstractUser):
     first_name = None
     last_name = None
@@ -41,17 +56,66 @@ class Member(AbstractUser):
         verbose_name = _("사용자")
         verbose_name_plural = _("사용자")
 
+    def membership_state(self) -> MembershipState:
+        """
+        Returns the membership state of this member, which is loaded once
+        and reused until clear_membership_state is called.
+        """
+        state = getattr(self, "_membership_state", None)
+        if state is None:
+            state = self._load_membership_state()
+            self._membership_state = state
+        return state
+
+    def clear_membership_state(self):
+        self._membership_state = None
+
+    def _load_membership_state(self) -> MembershipState:
+        # 멤버십과 구독 정보가 미리 조회되어 있으면 추가 조회 없이 사용한다.
+        if self.is_subscriptions_prefetched() and Member.membership.is_cached(self):
+            membership = getattr(self, "membership", None)
+            sub = self.latest_subscription()
+            return MembershipState(
+                is_activated=bool(membership and membership.is_active),
+                last_activated_at=membership.last_activated_at if membership else None,
+                started_at=sub.started_at if sub else None,
+                ended_at=sub.ended_at if sub else None,
+            )
+
+        latest_sub = self.subscriptions.order_by("-ended_at")
+        row = (
+            Member.objects.filter(pk=self.pk)
+            .annotate(
+                sub_started_at=Subquery(latest_sub.values("started_at")[:1]),
+                sub_ended_at=Subquery(latest_sub.values("ended_at")[:1]),
+            )
+            .values(
+                "membership__is_active",
+                "membership__last_activated_at",
+                "sub_started_at",
+                "sub_ended_at",
+            )
+            .first()
+        )
+        if row is None:
+            return MembershipState(False, None, None, None)
+
+        return MembershipState(
+            is_activated=bool(row["membership__is_active"]),
+            last_activated_at=row["membership__last_activated_at"],
+            started_at=row["sub_started_at"],
+            ended_at=row["sub_ended_at"],
+        )
+
     def has_membership_benefits(self) -> bool:
-        cur_datetime = timezone.now()
-        return self.subscriptions.filter(ended_at__gt=cur_datetime).exists()
+        ended_at = self.membership_state().ended_at
+        return ended_at is not None and ended_at > timezone.now()
 
     has_membership_benefits.short_description = _("멤버십 혜택 여부")
     has_membership_benefits.boolean = True
 
     def is_membership_activated(self) -> bool:
-        if not hasattr(self, "membership"):
-            return False
-        return self.membership.is_active
+        return self.membership_state().is_activated
 
     is_membership_activated.short_description = _("멤버십 활성화 여부")
     is_membership_activated.boolean = True
@@ -60,40 +124,53 @@ class Member(AbstractUser):
         imp_client = IMPHelper()
         return imp_client.is_customer_uid_exist(self.billing_key)
 
-    def active_subscription(self):
-        cur_datetime = timezone.now()
+    def is_subscriptions_prefetched(self) -> bool:
+        return "subscriptions" in getattr(self, "_prefetched_objects_cache", {})
+
+    def latest_subscription(self):
+        # prefetch 된 구독 정보가 있으면 추가 조회 없이 사용한다.
+        if self.is_subscriptions_prefetched():
+            return max(
+                self.subscriptions.all(), key=lambda sub: sub.ended_at, default=None
+            )
+
         try:
-            sub = self.subscriptions.latest("ended_at")
+            return self.subscriptions.latest("ended_at")
         except models.ObjectDoesNotExist:
             return None
 
+    def active_subscription(self):
+        cur_datetime = timezone.now()
+        sub = self.latest_subscription()
+        if not sub:
+            return None
+
         if sub.ended_at < cur_datetime:
             return None
         return sub
 
     def next_membership_payment(self) -> Optional[datetime]:
-        if not hasattr(self, "membership"):
-            return None
-        if not self.membership.is_active:
+        state = self.membership_state()
+        if not state.is_activated:
             return None
 
-        sub = self.active_subscription()
-        if not sub:
+        if not state.is_subscription_active():
             raise Exception("Membership is active but there is no active subscription!")
-        return sub.ended_at
+        return state.ended_at
 
     def total_membership_days(self) -> int:
         cur_datetime = timezone.now()
-        if not hasattr(self, "membership"):
+        state = self.membership_state()
+        if not state.is_activated:
             return 0
-        if not self.membership.is_active:
+        if not state.last_activated_at:
             return 0
-        if not self.membership.last_activated_at:
-            return 0
-        return (cur_datetime - self.membership.last_activated_at).days
+        return (cur_datetime - state.last_activated_at).days
+
+    visitation_counter = RelatedCounter("visitations", "visitation_cnt")
 
     def total_visitation_cnt(self) -> int:
-        return len(self.visitations.all())
+        return Member.visitation_counter.count(self)
 
     @property
     def billing_key(self) -> str:
@@ -215,6 +215,13 @@ class MemberSerializer(serializers.ModelSerializer):
     end_subscription_date = serializers.SerializerMethodField()
     profile_image = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        queryset = Member.visitation_counter.annotate(queryset)
+        return queryset.select_related("membership", "profile_image").prefetch_related(
+            "subscriptions"
+        )
+
     def get_next_membership_payment(self, obj: Member):
         np = obj.next_membership_payment()
         if not np:
@@ -222,16 +229,16 @@ class MemberSerializer(serializers.ModelSerializer):
         return np.strftime("%Y년 %m월 %d일")
 
     def get_start_subscription_date(self, obj: Member):
-        sub = obj.active_subscription()
-        if not sub:
+        state = obj.membership_state()
+        if not state.is_subscription_active():
             return None
-        return sub.started_at.strftime("%Y년 %m월 %d일")
+        return state.started_at.strftime("%Y년 %m월 %d일")
 
     def get_end_subscription_date(self, obj: Member):
-        sub = obj.active_subscription()
-        if not sub:
+        state = obj.membership_state()
+        if not state.is_subscription_active():
             return None
-        return sub.ended_at.strftime("%Y년 %m월 %d일")
+        return state.ended_at.strftime("%Y년 %m월 %d일")
 
     def get_profile_image(self, obj: Member):
         if hasattr(obj, "profile_image"):
@@ -0,0 +1,29 @@
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from ggongsul.membership.models import Membership, Subscription
+from ggongsul.visitation.models import Visitation
+
+from .models import Member
+
+
+class MemberQueryCountTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = Member.objects.create_user(username="member", password="pw")
+        Membership.objects.create(
+            member=cls.member, is_active=True, last_activated_at=timezone.now()
+        )
+        for _ in range(3):
+            Subscription.create_subscription(
+                member=cls.member, started_at=timezone.now()
+            )
+            Visitation.objects.create(member=cls.member)
+
+    def test_me(self):
+        self.client.force_authenticate(self.member)
+        # 멤버십 상태, 방문 수, 프로필 사진
+        with self.assertNumQueries(3):
+            resp = self.client.get("/api/v1/members/me/")
+        self.assertEqual(resp.json()["total_visitation_cnt"], 3)
+        self.assertTrue(resp.json()["has_membership_benefits"])
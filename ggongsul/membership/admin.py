@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from ggongsul.membership.models import Membership, Subscription, Payment
+from ggongsul.membership.models import Membership, Subscription, Payment, RenewalRun
 
 
 class MembershipInline(admin.StackedInline):
@@ -19,7 +19,7 @@ class MembershipInline(admin.StackedInline):
 class PaymentInline(admin.StackedInline):
     model = Payment
     extra = 0
-    readonly_fields = ("paid_at", "canceled_at")
+    readonly_fields = ("status", "attempt_cnt", "fail_reason", "paid_at", "canceled_at")
     can_delete = False
 
 
@@ -27,3 +27,19 @@ class PaymentInline(admin.StackedInline):
 class SubscriptionAdmin(admin.ModelAdmin):
     inlines = (PaymentInline,)
     list_display = ("__str__", "payment_yn", "validity_days")
+
+
+@admin.register(RenewalRun)
+class RenewalRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "__str__",
+        "candidate_cnt",
+        "no_subscription_cnt",
+        "chunk_cnt",
+        "finished_chunk_cnt",
+        "renewed_cnt",
+        "skipped_cnt",
+        "failed_cnt",
+        "finished_at",
+    )
+    readonly_fields = [f.name for f in RenewalRun._meta.fields]
@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ggongsul.membership.models import Payment
+from ggongsul.membership.tasks import execute_payment
+
+
+class Command(BaseCommand):
+    help = "Enqueues the payments left pending, e.g. after their task gave up."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=10,
+            help="Only payments pending longer than this many minutes.",
+        )
+
+    def handle(self, *args, **options):
+        created_before = timezone.now() - timedelta(minutes=options["older_than"])
+        payment_ids = Payment.objects.filter(
+            status=Payment.PaymentStatus.PENDING, created_on__lt=created_before
+        ).values_list("id", flat=True)
+
+        cnt = 0
+        for payment_id in payment_ids.iterator():
+            execute_payment.delay(payment_id)
+            cnt += 1
+
+        self.stdout.write(self.style.SUCCESS(f"enqueued payment count: {cnt}"))
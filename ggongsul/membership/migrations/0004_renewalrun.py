@@ -0,0 +1,58 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0003_membership_last_renewed_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RenewalRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "total_membership_cnt",
+                    models.IntegerField(default=0, verbose_name="활성화된 멤버십 수"),
+                ),
+                (
+                    "candidate_cnt",
+                    models.IntegerField(default=0, verbose_name="갱신 대상 멤버십 수"),
+                ),
+                (
+                    "chunk_cnt",
+                    models.IntegerField(default=0, verbose_name="갱신 작업 묶음 수"),
+                ),
+                (
+                    "finished_chunk_cnt",
+                    models.IntegerField(default=0, verbose_name="완료된 갱신 작업 묶음 수"),
+                ),
+                ("renewed_cnt", models.IntegerField(default=0, verbose_name="갱신 성공 수")),
+                ("failed_cnt", models.IntegerField(default=0, verbose_name="갱신 실패 수")),
+                (
+                    "finished_at",
+                    models.DateTimeField(null=True, verbose_name="갱신 완료 날짜"),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 날짜"),
+                ),
+            ],
+            options={
+                "verbose_name": "구독 갱신 작업",
+                "verbose_name_plural": "구독 갱신 작업",
+                "ordering": ["-id"],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0004_renewalrun"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="renewalrun",
+            name="skipped_cnt",
+            field=models.IntegerField(default=0, verbose_name="갱신 생략 수"),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0005_renewalrun_skipped_cnt"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="payment",
+            name="fail_reason",
+            field=models.CharField(
+                blank=True, max_length=256, null=True, verbose_name="결제 실패 사유"
+            ),
+        ),
+        migrations.AddField(
+            model_name="payment",
+            name="name",
+            field=models.CharField(default="", max_length=128, verbose_name="결제 이름"),
+        ),
+        # 기존 결제는 모두 결제가 완료된 상태로 생성한다.
+        migrations.AddField(
+            model_name="payment",
+            name="status",
+            field=models.IntegerField(
+                choices=[(1, "결제 대기"), (2, "결제 완료"), (3, "결제 실패")],
+                db_index=True,
+                default=2,
+                verbose_name="결제 상태",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="status",
+            field=models.IntegerField(
+                choices=[(1, "결제 대기"), (2, "결제 완료"), (3, "결제 실패")],
+                db_index=True,
+                default=1,
+                verbose_name="결제 상태",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="imp_uid",
+            field=models.CharField(max_length=64, null=True, verbose_name="아임포트 고유 id"),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="paid_at",
+            field=models.DateTimeField(null=True, verbose_name="결제 날짜"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0006_payment_outbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="renewalrun",
+            name="no_subscription_cnt",
+            field=models.IntegerField(default=0, verbose_name="구독 정보가 없는 멤버십 수"),
+        ),
+    ]
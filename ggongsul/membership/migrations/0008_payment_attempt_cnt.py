@@ -0,0 +1,28 @@
+# Generated by Django 3.1.14 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0007_renewalrun_no_subscription_cnt"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="payment",
+            name="attempt_cnt",
+            field=models.IntegerField(default=0, verbose_name="결제 시도 횟수"),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="status",
+            field=models.IntegerField(
+                choices=[(1, "결제 대기"), (2, "결제 완료"), (3, "결제 실패"), (4, "결제 중단")],
+                db_index=True,
+                default=1,
+                verbose_name="결제 상태",
+            ),
+        ),
+    ]
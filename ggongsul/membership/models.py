@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import secrets
 from datetime import datetime, timedelta
+from typing import Optional
 
+from django.conf import settings
 from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from ggongsul.core.exceptions import CommError
 from ggongsul.lib.iamport import IMPHelper
 from ggongsul.member.models import Member
 
@@ -55,6 +59,7 @@ class Membership(models.Model):
             self.is_active = True
             self.last_activated_at = cur_datetime
             self.save()
+            self.member.clear_membership_state()
             return
 
         sub = Subscription.create_subscription(
@@ -69,18 +74,68 @@ class Membership(models.Model):
                 subscription=sub,
                 name="{} 결제".format(str(sub)),
                 amount=Membership.MEMBERSHIP_PRICE,
-                billing_key=self.member.billing_key,
             )
 
         self.is_active = True
         self.last_activated_at = cur_datetime
         self.save()
+        self.member.clear_membership_state()
+
+    @staticmethod
+    def renewal_due_until() -> datetime:
+        """
+        Subscriptions ending before this datetime are renewed by the daily job.
+        """
+        return (timezone.now() + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+
+    @staticmethod
+    def renewal_payment_uid(subscription: Subscription) -> str:
+        # 같은 구독 기간의 갱신 결제는 항상 같은 id 를 사용해서 중복 결제를 막는다.
+        return f"ggongsul-renew-{subscription.member_id}-{subscription.id}"
 
     @transaction.atomic
-    def renew_subscription(self):
+    def renew_subscription(self) -> bool:
+        """
+        Renews the latest subscription if it is due, returns False when
+        there is nothing to renew.
+        """
         cur_datetime = timezone.now()
 
-        old_subscription = self.member.subscriptions.latest("-ended_at")
+        # 동시에 실행된 갱신 작업은 여기서 대기한 뒤 이미 갱신된 구독을 보고 종료한다.
+        membership = Membership.objects.select_for_update().get(pk=self.pk)
+        if not membership.is_active:
+            return False
+
+        try:
+            old_subscription = self.member.subscriptions.latest("ended_at")
+        except Subscription.DoesNotExist:
+            return False
+        if old_subscription.ended_at >= Membership.renewal_due_until():
+            return False
+
+        # 갱신할 구독의 결제가 실패했다면 다시 결제를 시도하고, 결제된 후에 갱신한다.
+        unpaid_payment = Payment.objects.filter(
+            subscription=old_subscription, status=Payment.PaymentStatus.FAILED
+        ).first()
+        if unpaid_payment is not None:
+            if unpaid_payment.is_retryable():
+                unpaid_payment.retry()
+                return False
+
+            # 끝내 결제되지 않은 구독은 더 이상 갱신하지 않는다.
+            unpaid_payment.abandon()
+            membership.is_active = False
+            membership.last_deactivated_at = cur_datetime
+            membership.save(
+                update_fields=["is_active", "last_deactivated_at", "updated_on"]
+            )
+            self.is_active = False
+            self.last_deactivated_at = cur_datetime
+            self.member.clear_membership_state()
+            return False
+
         new_subscription = Subscription.create_subscription(
             member=self.member, started_at=cur_datetime
         )
@@ -91,11 +146,14 @@ class Membership(models.Model):
                 subscription=new_subscription,
                 name="{} 결제".format(str(new_subscription)),
                 amount=Membership.MEMBERSHIP_PRICE,
-                billing_key=self.member.billing_key,
+                payment_uid=Membership.renewal_payment_uid(old_subscription),
             )
 
+        membership.last_renewed_at = cur_datetime
+        membership.save(update_fields=["last_renewed_at", "updated_on"])
         self.last_renewed_at = cur_datetime
-        self.save()
+        self.member.clear_membership_state()
+        return True
 
     def process_unsubscribe(self):
         cur_datetime = timezone.now()
@@ -112,6 +170,7 @@ class Membership(models.Model):
         self.is_active = False
         self.last_deactivated_at = cur_datetime
         self.save()
+        self.member.clear_membership_state()
 
 
 class Subscription(models.Model):
@@ -142,7 +201,10 @@ class Subscription(models.Model):
         verbose_name_plural = _("구독 정보")
 
     def payment_yn(self):
-        return hasattr(self, "payment")
+        return (
+            hasattr(self, "payment")
+            and self.payment.status == Payment.PaymentStatus.PAID
+        )
 
     payment_yn.short_description = _("결제 여부")
     payment_yn.boolean = True
@@ -160,12 +222,8 @@ class Subscription(models.Model):
         validity_days: int = None,
         ended_at: datetime = None,
     ):
-        if not validity_days:
-            validity_days = cls.DEFAULT_VALIDITY_DAYS
         if not ended_at:
-            ended_at = (started_at + timedelta(days=validity_days)).replace(
-                hour=23, minute=59, second=59, microsecond=0
-            )
+            ended_at = cls.default_ended_at(started_at, validity_days)
 
         return cls.objects.create(
             member=member,
@@ -173,6 +231,14 @@ class Subscription(models.Model):
             ended_at=ended_at,
         )
 
+    @classmethod
+    def default_ended_at(cls, started_at: datetime, validity_days: int = None):
+        if not validity_days:
+            validity_days = cls.DEFAULT_VALIDITY_DAYS
+        return (started_at + timedelta(days=validity_days)).replace(
+            hour=23, minute=59, second=59, microsecond=0
+        )
+
     def is_in_refund_validity_days(self) -> bool:
         cur_datetime = timezone.now()
         refund_validity_datetime = self.started_at + timedelta(
@@ -190,6 +256,12 @@ class Payment(models.Model):
     class PaymentType(models.IntegerChoices):
         KAKAOPAY = 1, _("카카오페이")
 
+    class PaymentStatus(models.IntegerChoices):
+        PENDING = 1, _("결제 대기")
+        PAID = 2, _("결제 완료")
+        FAILED = 3, _("결제 실패")
+        ABANDONED = 4, _("결제 중단")
+
     subscription = models.OneToOneField(
         Subscription,
         related_name="payment",
@@ -203,11 +275,22 @@ class Payment(models.Model):
     payment_type = models.IntegerField(
         choices=PaymentType.choices, verbose_name=_("결제 수단")
     )
-    imp_uid = models.CharField(max_length=64, verbose_name=_("아임포트 고유 id"))
+    status = models.IntegerField(
+        choices=PaymentStatus.choices,
+        default=PaymentStatus.PENDING,
+        db_index=True,
+        verbose_name=_("결제 상태"),
+    )
+    name = models.CharField(max_length=128, default="", verbose_name=_("결제 이름"))
+    imp_uid = models.CharField(max_length=64, null=True, verbose_name=_("아임포트 고유 id"))
     amount = models.IntegerField(verbose_name=_("결제 금액"))
+    attempt_cnt = models.IntegerField(default=0, verbose_name=_("결제 시도 횟수"))
     canceled_amount = models.IntegerField(default=0, verbose_name=_("결제 취소 금액"))
+    fail_reason = models.CharField(
+        max_length=256, null=True, blank=True, verbose_name=_("결제 실패 사유")
+    )
 
-    paid_at = models.DateTimeField(verbose_name=_("결제 날짜"))
+    paid_at = models.DateTimeField(null=True, verbose_name=_("결제 날짜"))
     canceled_at = models.DateTimeField(null=True, verbose_name=_("결제 취소 날짜"))
 
     created_on = models.DateTimeField(auto_now_add=True, verbose_name=_("생성 날짜"))
@@ -226,27 +309,130 @@ class Payment(models.Model):
 
     @classmethod
     def create_payment(
-        cls, subscription: Subscription, name: str, amount: int, billing_key: str
-    ):
-        cur_datetime = timezone.now()
-        imp_client = IMPHelper()
-        payment_uid = (
-            f"ggongsul-{cur_datetime.strftime('%y%m%d%H%M%S')}-{secrets.token_hex(3)}"
-        )
+        cls,
+        subscription: Subscription,
+        name: str,
+        amount: int,
+        payment_uid: str = None,
+    ) -> Payment:
+        """
+        Records a pending payment, which is charged by a celery task after
+        the current transaction is committed.
+        """
+        from ggongsul.membership.tasks import execute_payment
 
-        resp = imp_client.make_payment(billing_key, payment_uid, amount, name)
-        imp_uid = resp["imp_uid"]
+        cur_datetime = timezone.now()
+        if not payment_uid:
+            payment_uid = "ggongsul-{}-{}".format(
+                cur_datetime.strftime("%y%m%d%H%M%S"), secrets.token_hex(3)
+            )
 
-        return cls.objects.create(
+        payment = cls.objects.create(
             subscription=subscription,
             payment_uid=payment_uid,
             payment_type=cls.PaymentType.KAKAOPAY,
-            imp_uid=imp_uid,
+            name=name,
             amount=amount,
-            paid_at=cur_datetime,
         )
+        transaction.on_commit(lambda: execute_payment.delay(payment.id))
+        return payment
+
+    def execute(self) -> bool:
+        """
+        Charges the pending payment with the billing key of the subscriber.
+        It is safe to call again after an interrupted attempt since
+        payment_uid is used as the merchant_uid.
+        """
+        if self.subscription is None:
+            self._mark_failed(None, "subscription is deleted!")
+            return False
+
+        imp_client = IMPHelper()
+
+        # 이전 시도에서 결제는 되었지만 결과를 저장하지 못했을 수 있다.
+        resp = imp_client.find_payment(self.payment_uid)
+        # 실패한 merchant_uid 는 다시 결제할 수 있다.
+        if resp is None or resp["status"] == "failed":
+            self.attempt_cnt += 1
+            self.save(update_fields=["attempt_cnt", "updated_on"])
+            resp = imp_client.make_payment(
+                self.subscription.member.billing_key,
+                self.payment_uid,
+                self.amount,
+                self.name,
+            )
+
+        if resp["status"] == "paid":
+            self._mark_paid(resp["imp_uid"])
+            return True
+
+        self._mark_failed(resp["imp_uid"], resp.get("fail_reason"))
+        return False
+
+    @transaction.atomic
+    def _mark_paid(self, imp_uid: str):
+        self.status = Payment.PaymentStatus.PAID
+        self.imp_uid = imp_uid
+        self.paid_at = timezone.now()
+        self.save(update_fields=["status", "imp_uid", "paid_at", "updated_on"])
+
+        # 재시도 끝에 결제되었다면 실패 시 종료했던 구독 혜택을 결제된 시점부터 다시 제공한다.
+        subscription = self.subscription
+        if subscription and subscription.ended_at < Subscription.default_ended_at(
+            subscription.started_at
+        ):
+            subscription.started_at = self.paid_at
+            subscription.ended_at = Subscription.default_ended_at(self.paid_at)
+            subscription.save(update_fields=["started_at", "ended_at", "updated_on"])
+            subscription.member.clear_membership_state()
+
+    @transaction.atomic
+    def _mark_failed(self, imp_uid: Optional[str], reason: str = None):
+        cur_datetime = timezone.now()
+        self.status = Payment.PaymentStatus.FAILED
+        self.imp_uid = imp_uid
+        self.fail_reason = (reason or "")[:256]
+        self.save(update_fields=["status", "imp_uid", "fail_reason", "updated_on"])
+
+        # 결제되지 않은 구독의 혜택은 바로 종료하며, 결제는 다음 갱신 때 다시 시도한다.
+        if self.subscription and self.subscription.ended_at > cur_datetime:
+            self.subscription.ended_at = cur_datetime
+            self.subscription.save(update_fields=["ended_at", "updated_on"])
+            self.subscription.member.clear_membership_state()
+
+    def is_retryable(self) -> bool:
+        """
+        Returns whether the failed payment may be charged again, which is
+        allowed MEMBERSHIP_PAYMENT_MAX_ATTEMPTS times within
+        MEMBERSHIP_PAYMENT_RETRY_DAYS days after it was created.
+        """
+        retry_until = self.created_on + timedelta(
+            days=settings.MEMBERSHIP_PAYMENT_RETRY_DAYS
+        )
+        return (
+            self.attempt_cnt < settings.MEMBERSHIP_PAYMENT_MAX_ATTEMPTS
+            and timezone.now() < retry_until
+        )
+
+    def abandon(self):
+        self.status = Payment.PaymentStatus.ABANDONED
+        self.save(update_fields=["status", "updated_on"])
+
+    def retry(self):
+        """
+        Charges the failed payment again after the current transaction is
+        committed.
+        """
+        from ggongsul.membership.tasks import execute_payment
+
+        self.status = Payment.PaymentStatus.PENDING
+        self.save(update_fields=["status", "updated_on"])
+        transaction.on_commit(lambda: execute_payment.delay(self.id))
 
     def cancel_payment(self, reason: str = None):
+        if self.status != Payment.PaymentStatus.PAID:
+            raise CommError(f"payment {self.payment_uid} is not paid!")
+
         cur_datetime = timezone.now()
         imp_client = IMPHelper()
 
@@ -254,3 +440,55 @@ class Payment(models.Model):
         self.canceled_at = cur_datetime
         self.canceled_amount = resp["cancel_amount"]
         self.save()
+
+
+class RenewalRun(models.Model):
+    total_membership_cnt = models.IntegerField(default=0, verbose_name=_("활성화된 멤버십 수"))
+    candidate_cnt = models.IntegerField(default=0, verbose_name=_("갱신 대상 멤버십 수"))
+    no_subscription_cnt = models.IntegerField(
+        default=0, verbose_name=_("구독 정보가 없는 멤버십 수")
+    )
+    chunk_cnt = models.IntegerField(default=0, verbose_name=_("갱신 작업 묶음 수"))
+    finished_chunk_cnt = models.IntegerField(
+        default=0, verbose_name=_("완료된 갱신 작업 묶음 수")
+    )
+    renewed_cnt = models.IntegerField(default=0, verbose_name=_("갱신 성공 수"))
+    skipped_cnt = models.IntegerField(default=0, verbose_name=_("갱신 생략 수"))
+    failed_cnt = models.IntegerField(default=0, verbose_name=_("갱신 실패 수"))
+
+    finished_at = models.DateTimeField(null=True, verbose_name=_("갱신 완료 날짜"))
+    created_on = models.DateTimeField(auto_now_add=True, verbose_name=_("생성 날짜"))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return f"{self.created_on.strftime('%Y-%m-%d')} 구독 갱신 작업"
+
+    class Meta:
+        ordering = ["-id"]
+        verbose_name = _("구독 갱신 작업")
+        verbose_name_plural = _("구독 갱신 작업")
+
+    @classmethod
+    def record_chunk(
+        cls, run_id: int, renewed_cnt: int, skipped_cnt: int, failed_cnt: int
+    ) -> Optional[RenewalRun]:
+        """
+        Adds the result of a chunk and returns the run if it was the last one.
+        """
+        with transaction.atomic():
+            cls.objects.filter(id=run_id).update(
+                finished_chunk_cnt=F("finished_chunk_cnt") + 1,
+                renewed_cnt=F("renewed_cnt") + renewed_cnt,
+                skipped_cnt=F("skipped_cnt") + skipped_cnt,
+                failed_cnt=F("failed_cnt") + failed_cnt,
+            )
+            # update 로 잡은 row lock 때문에 마지막 묶음은 정확히 하나의 worker 만 보게 된다.
+            run = cls.objects.select_for_update().get(id=run_id)
+            if run.finished_at or run.finished_chunk_cnt < run.chunk_cnt:
+                return None
+
+            run.finished_at = timezone.now()
+            run.save(update_fields=["finished_at"])
+            return run
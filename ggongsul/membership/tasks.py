@@ -1,42 +1,151 @@
-from datetime import timedelta
+import logging
 
-from celery import shared_task
+from typing import List
+
+from celery import group, shared_task
+from requests import RequestException
+from django.conf import settings
+from django.db.models import Max
 from django.utils import timezone
 
 from ggongsul.common.enums import SlackAlertLevel
-from ggongsul.common.utils import send_slack_msg
-from ggongsul.member.models import Member
-from ggongsul.membership.models import Membership
+from ggongsul.common.utils import logging_traceback, send_slack_msg
+from ggongsul.core.exceptions import BadResponse, CommError
+from ggongsul.membership.models import Membership, Payment, RenewalRun
 
+logger = logging.getLogger(__name__)
 
-@shared_task
-def check_expire_membership():
-    tomorrow = (timezone.now() + timedelta(days=1)).replace(
-        hour=0, minute=0, second=0, microsecond=0
+
+def renewal_candidate_member_ids(until) -> List[int]:
+    """
+    Returns ids of members whose active membership's latest subscription
+    ends before `until`.
+    """
+    return list(
+        Membership.objects.filter(is_active=True, member__is_active=True)
+        .annotate(last_ended_at=Max("member__subscriptions__ended_at"))
+        .filter(last_ended_at__lt=until)
+        .order_by("member_id")
+        .values_list("member_id", flat=True)
     )
-    total_membership_cnt = 0
-    renew_cnt = 0
 
-    for member in Member.objects.filter(is_active=True, membership__is_active=True):
-        total_membership_cnt += 1
-        if member.next_membership_payment() >= tomorrow:
-            continue
 
-        renew_subscription.delay(member.id)
-        renew_cnt += 1
+def no_subscription_member_ids() -> List[int]:
+    """
+    Returns ids of members who have an active membership but no
+    subscription, which can not be renewed.
+    """
+    return list(
+        Membership.objects.filter(
+            is_active=True,
+            member__is_active=True,
+            member__subscriptions__isnull=True,
+        )
+        .order_by("member_id")
+        .values_list("member_id", flat=True)
+    )
+
 
+def send_renewal_summary(run: RenewalRun):
     send_slack_msg(
         title="Check Expire Membership",
         text=f"successfully done!",
         fields={
-            "total membership count": total_membership_cnt,
-            "renew subscription count": renew_cnt,
+            "total membership count": run.total_membership_cnt,
+            "renew subscription count": run.candidate_cnt,
+            "no subscription count": run.no_subscription_cnt,
+            "renewed count": run.renewed_cnt,
+            "skipped count": run.skipped_cnt,
+            "failed count": run.failed_cnt,
         },
-        alert_level=SlackAlertLevel.INFO,
+        alert_level=SlackAlertLevel.INFO
+        if not run.failed_cnt and not run.no_subscription_cnt
+        else SlackAlertLevel.WARNING,
+    )
+
+
+@shared_task
+def check_expire_membership():
+    member_ids = renewal_candidate_member_ids(Membership.renewal_due_until())
+    no_subscription_ids = no_subscription_member_ids()
+    if no_subscription_ids:
+        logger.warning(
+            f"members without subscription are not renewed: {no_subscription_ids}"
+        )
+
+    chunk_size = settings.MEMBERSHIP_RENEWAL_CHUNK_SIZE
+    chunks = [
+        member_ids[i : i + chunk_size] for i in range(0, len(member_ids), chunk_size)
+    ]
+    run = RenewalRun.objects.create(
+        total_membership_cnt=Membership.objects.filter(
+            is_active=True, member__is_active=True
+        ).count(),
+        candidate_cnt=len(member_ids),
+        no_subscription_cnt=len(no_subscription_ids),
+        chunk_cnt=len(chunks),
     )
 
+    if not chunks:
+        run.finished_at = timezone.now()
+        run.save(update_fields=["finished_at"])
+        send_renewal_summary(run)
+        return
+
+    group(renew_subscriptions.s(run.id, chunk) for chunk in chunks).apply_async()
+
+
+@shared_task
+def renew_subscriptions(run_id: int, member_ids: List[int]):
+    renewed_cnt = 0
+    skipped_cnt = 0
+    failed_cnt = 0
+
+    memberships = Membership.objects.filter(member_id__in=member_ids).select_related(
+        "member"
+    )
+    for membership in memberships:
+        try:
+            if membership.renew_subscription():
+                renewed_cnt += 1
+            else:
+                skipped_cnt += 1
+        except Exception:
+            # 한 명의 실패가 같은 묶음의 다른 사용자 갱신을 막지 않도록 한다.
+            logging_traceback()
+            failed_cnt += 1
+
+    run = RenewalRun.record_chunk(run_id, renewed_cnt, skipped_cnt, failed_cnt)
+    if run:
+        send_renewal_summary(run)
+
 
 @shared_task
 def renew_subscription(member_id: int):
     membership = Membership.objects.get(member_id=member_id)
     membership.renew_subscription()
+
+
+@shared_task(bind=True, max_retries=5)
+def execute_payment(self, payment_id: int):
+    payment = Payment.objects.select_related("subscription__member").get(id=payment_id)
+    if payment.status != Payment.PaymentStatus.PENDING:
+        return
+
+    try:
+        is_paid = payment.execute()
+    except (BadResponse, CommError, RequestException) as e:
+        raise self.retry(exc=e, countdown=10 * 2**self.request.retries)
+
+    if not is_paid:
+        subscription = payment.subscription
+        send_slack_msg(
+            title="Membership Payment Failed",
+            text=f"{payment.payment_uid} 결제에 실패했습니다.",
+            fields={
+                "member": subscription.member.username if subscription else None,
+                "amount": payment.amount,
+                "reason": payment.fail_reason,
+            },
+            alert_level=SlackAlertLevel.WARNING,
+        )
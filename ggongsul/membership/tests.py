@@ -0,0 +1,404 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from ggongsul.celery import app as celery_app
+from ggongsul.common.enums import SlackAlertLevel
+from ggongsul.core.exceptions import CommError
+from ggongsul.member.models import Member
+from ggongsul.visitation.models import Visitation
+
+from .models import Membership, Payment, RenewalRun, Subscription
+from .tasks import check_expire_membership, execute_payment
+
+
+def create_member(username: str = "member", ended_at=None) -> Member:
+    """
+    Creates a member with an active membership whose subscription ends at
+    `ended_at`.
+    """
+    member = Member.objects.create_user(username=username, password="pw")
+    Membership.objects.create(
+        member=member, is_active=True, last_activated_at=timezone.now()
+    )
+    if ended_at is not None:
+        Subscription.create_subscription(
+            member=member,
+            started_at=ended_at - timedelta(days=Subscription.DEFAULT_VALIDITY_DAYS),
+            ended_at=ended_at,
+        )
+    return member
+
+
+def create_payment(subscription: Subscription, **kwargs) -> Payment:
+    return Payment.objects.create(
+        subscription=subscription,
+        payment_uid=f"ggongsul-test-{subscription.id}",
+        payment_type=Payment.PaymentType.KAKAOPAY,
+        amount=Membership.MEMBERSHIP_PRICE,
+        **kwargs,
+    )
+
+
+def run_on_commit():
+    # TestCase 는 commit 하지 않으므로 on_commit 콜백을 바로 실행한다.
+    return mock.patch(
+        "django.db.transaction.on_commit", side_effect=lambda func: func()
+    )
+
+
+class RenewSubscriptionTest(TestCase):
+    def setUp(self):
+        self.member = create_member(ended_at=timezone.now() - timedelta(days=1))
+        self.subscription = self.member.subscriptions.get()
+        # 이전 구독 기간에 혜택을 받은 기록
+        visitation = Visitation.objects.create(member=self.member)
+        Visitation.objects.filter(id=visitation.id).update(
+            created_on=timezone.now() - timedelta(days=5)
+        )
+
+    def renew(self) -> bool:
+        return Membership.objects.get(member=self.member).renew_subscription()
+
+    def test_renew(self):
+        self.assertTrue(self.renew())
+
+        new_subscription = self.member.subscriptions.latest("ended_at")
+        self.assertNotEqual(new_subscription.id, self.subscription.id)
+        self.assertEqual(
+            new_subscription.payment.payment_uid,
+            Membership.renewal_payment_uid(self.subscription),
+        )
+        self.assertIsNotNone(Membership.objects.get(member=self.member).last_renewed_at)
+
+    def test_renew_twice(self):
+        self.assertTrue(self.renew())
+        # 같은 기간의 갱신은 다시 실행되지 않는다.
+        self.assertFalse(self.renew())
+        self.assertEqual(self.member.subscriptions.count(), 2)
+        self.assertEqual(Payment.objects.count(), 1)
+
+    def test_renew_without_benefits(self):
+        Visitation.objects.all().delete()
+
+        self.assertTrue(self.renew())
+        self.assertFalse(Payment.objects.exists())
+
+    def test_latest_subscription(self):
+        # 최근 구독이 아직 남아 있으면 이전 구독이 끝났더라도 갱신하지 않는다.
+        Subscription.create_subscription(
+            member=self.member,
+            started_at=timezone.now() - timedelta(days=1),
+            ended_at=timezone.now() + timedelta(days=10),
+        )
+        Subscription.objects.filter(id=self.subscription.id).update(
+            ended_at=timezone.now() - timedelta(days=40)
+        )
+
+        self.assertFalse(self.renew())
+        self.assertEqual(self.member.subscriptions.count(), 2)
+
+    def test_not_due(self):
+        Subscription.objects.filter(id=self.subscription.id).update(
+            ended_at=timezone.now() + timedelta(days=2)
+        )
+
+        self.assertFalse(self.renew())
+        self.assertEqual(self.member.subscriptions.count(), 1)
+
+    def test_inactive_membership(self):
+        Membership.objects.filter(member=self.member).update(is_active=False)
+
+        self.assertFalse(self.renew())
+        self.assertEqual(self.member.subscriptions.count(), 1)
+
+
+@mock.patch("ggongsul.membership.tasks.send_slack_msg")
+class CheckExpireMembershipTest(TestCase):
+    def setUp(self):
+        # 묶음별 갱신 작업(group)을 worker 없이 바로 실행한다.
+        always_eager = celery_app.conf.task_always_eager
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", always_eager)
+
+        self.due_until = Membership.renewal_due_until()
+
+    def create_members(self, cnt: int, ended_at) -> list:
+        return [
+            create_member(f"member{Member.objects.count()}", ended_at=ended_at).id
+            for _ in range(cnt)
+        ]
+
+    def test_due_boundary(self, send_slack_msg):
+        due = self.create_members(1, self.due_until - timedelta(seconds=1))
+        self.create_members(1, self.due_until)
+
+        check_expire_membership()
+        run = RenewalRun.objects.get()
+        self.assertEqual(run.candidate_cnt, 1)
+        self.assertEqual(run.renewed_cnt, 1)
+        self.assertEqual(
+            list(
+                Subscription.objects.filter(ended_at__gt=self.due_until).values_list(
+                    "member_id", flat=True
+                )
+            ),
+            due,
+        )
+
+    @override_settings(MEMBERSHIP_RENEWAL_CHUNK_SIZE=2)
+    def test_chunks(self, send_slack_msg):
+        self.create_members(5, self.due_until - timedelta(days=1))
+        self.create_members(1, self.due_until + timedelta(days=1))
+        create_member("no_subscription")
+
+        check_expire_membership()
+        run = RenewalRun.objects.get()
+        self.assertEqual(run.total_membership_cnt, 7)
+        self.assertEqual(run.candidate_cnt, 5)
+        self.assertEqual(run.no_subscription_cnt, 1)
+        self.assertEqual((run.chunk_cnt, run.finished_chunk_cnt), (3, 3))
+        self.assertEqual((run.renewed_cnt, run.skipped_cnt, run.failed_cnt), (5, 0, 0))
+        self.assertIsNotNone(run.finished_at)
+
+        # 마지막 묶음이 끝났을 때 한 번만 알린다.
+        send_slack_msg.assert_called_once()
+        self.assertEqual(send_slack_msg.call_args[1]["fields"]["renewed count"], 5)
+        self.assertEqual(
+            send_slack_msg.call_args[1]["alert_level"], SlackAlertLevel.WARNING
+        )
+
+    @override_settings(MEMBERSHIP_RENEWAL_CHUNK_SIZE=2)
+    @mock.patch("ggongsul.membership.tasks.logging_traceback")
+    def test_failed_member(self, _, send_slack_msg):
+        failed, *others = self.create_members(3, self.due_until - timedelta(days=1))
+        renew_subscription = Membership.renew_subscription
+
+        def renew(membership):
+            if membership.member_id == failed:
+                raise Exception("renewal failed")
+            return renew_subscription(membership)
+
+        with mock.patch.object(
+            Membership, "renew_subscription", autospec=True, side_effect=renew
+        ):
+            check_expire_membership()
+
+        run = RenewalRun.objects.get()
+        self.assertEqual((run.renewed_cnt, run.skipped_cnt, run.failed_cnt), (2, 0, 1))
+        self.assertEqual(
+            send_slack_msg.call_args[1]["alert_level"], SlackAlertLevel.WARNING
+        )
+
+    def test_no_candidates(self, send_slack_msg):
+        self.create_members(1, self.due_until + timedelta(days=1))
+        create_member("no_subscription")
+
+        with self.assertLogs("ggongsul.membership.tasks", "WARNING") as logs:
+            check_expire_membership()
+        self.assertIn(
+            str(Member.objects.get(username="no_subscription").id), logs.output[0]
+        )
+
+        run = RenewalRun.objects.get()
+        self.assertEqual((run.candidate_cnt, run.chunk_cnt), (0, 0))
+        self.assertEqual(run.no_subscription_cnt, 1)
+        self.assertIsNotNone(run.finished_at)
+        send_slack_msg.assert_called_once()
+
+
+@mock.patch("ggongsul.membership.models.IMPHelper")
+class PaymentExecuteTest(TestCase):
+    def setUp(self):
+        self.member = create_member()
+        self.subscription = Subscription.create_subscription(
+            member=self.member, started_at=timezone.now()
+        )
+        self.payment = create_payment(self.subscription)
+
+    def test_paid(self, imp_helper):
+        imp_helper().find_payment.return_value = None
+        imp_helper().make_payment.return_value = {"status": "paid", "imp_uid": "imp"}
+
+        self.assertTrue(self.payment.execute())
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.PAID)
+        self.assertEqual(self.payment.imp_uid, "imp")
+        self.assertEqual(self.payment.attempt_cnt, 1)
+
+    def test_already_paid(self, imp_helper):
+        # 이전 시도에서 결제된 결과를 저장하지 못한 경우 다시 결제하지 않는다.
+        imp_helper().find_payment.return_value = {"status": "paid", "imp_uid": "imp"}
+
+        self.assertTrue(self.payment.execute())
+        imp_helper().make_payment.assert_not_called()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.PAID)
+        self.assertEqual(self.payment.attempt_cnt, 0)
+
+    def test_failed(self, imp_helper):
+        imp_helper().find_payment.return_value = None
+        imp_helper().make_payment.return_value = {
+            "status": "failed",
+            "imp_uid": "imp",
+            "fail_reason": "잔액 부족",
+        }
+
+        self.assertFalse(self.payment.execute())
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.FAILED)
+        self.assertEqual(self.payment.fail_reason, "잔액 부족")
+        self.assertFalse(
+            Member.objects.get(id=self.member.id).has_membership_benefits()
+        )
+
+    def test_paid_after_failure(self, imp_helper):
+        imp_helper().find_payment.return_value = {"status": "failed"}
+        imp_helper().make_payment.return_value = {"status": "paid", "imp_uid": "imp"}
+        # 결제 실패로 구독 혜택이 종료된 상태
+        self.subscription.ended_at = timezone.now() - timedelta(days=2)
+        self.subscription.save()
+        self.payment.status = Payment.PaymentStatus.FAILED
+        self.payment.save()
+
+        self.assertTrue(self.payment.execute())
+        self.subscription.refresh_from_db()
+        # 결제된 시점부터 구독 혜택을 다시 제공한다.
+        self.assertEqual(self.subscription.started_at, self.payment.paid_at)
+        self.assertEqual(
+            self.subscription.ended_at,
+            Subscription.default_ended_at(self.payment.paid_at),
+        )
+
+    def test_subscription_deleted(self, imp_helper):
+        self.subscription.delete()
+        self.payment.refresh_from_db()
+
+        self.assertFalse(self.payment.execute())
+        imp_helper().make_payment.assert_not_called()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.FAILED)
+        self.assertEqual(self.payment.fail_reason, "subscription is deleted!")
+
+
+@mock.patch("ggongsul.membership.tasks.send_slack_msg")
+@mock.patch.object(Payment, "execute")
+class ExecutePaymentTaskTest(TestCase):
+    def setUp(self):
+        member = create_member()
+        subscription = Subscription.create_subscription(
+            member=member, started_at=timezone.now()
+        )
+        self.payment = create_payment(subscription)
+
+    def test_not_pending(self, execute, send_slack_msg):
+        self.payment.status = Payment.PaymentStatus.PAID
+        self.payment.save()
+
+        execute_payment.apply(args=[self.payment.id])
+        execute.assert_not_called()
+
+    def test_failed(self, execute, send_slack_msg):
+        execute.return_value = False
+
+        execute_payment.apply(args=[self.payment.id])
+        send_slack_msg.assert_called_once()
+        self.assertEqual(send_slack_msg.call_args[1]["fields"]["member"], "member")
+
+    @mock.patch("ggongsul.common.utils.send_slack_msg")
+    def test_comm_error(self, _, execute, send_slack_msg):
+        execute.side_effect = CommError("timeout")
+
+        result = execute_payment.apply(args=[self.payment.id])
+        # 처음 시도와 max_retries 번의 재시도
+        self.assertEqual(execute.call_count, 6)
+        self.assertTrue(result.failed())
+        send_slack_msg.assert_not_called()
+
+
+class PaymentRetryTest(TestCase):
+    def setUp(self):
+        self.member = create_member(ended_at=timezone.now() - timedelta(days=1))
+        self.subscription = self.member.subscriptions.get()
+        self.payment = create_payment(
+            self.subscription, status=Payment.PaymentStatus.FAILED, attempt_cnt=1
+        )
+
+    @mock.patch("ggongsul.membership.tasks.execute_payment.delay")
+    def test_retry(self, delay):
+        with run_on_commit():
+            self.payment.retry()
+
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.PENDING)
+        delay.assert_called_once_with(self.payment.id)
+
+    @mock.patch.object(Payment, "retry")
+    def test_renewal_retries_failed_payment(self, retry):
+        self.assertFalse(self.member.membership.renew_subscription())
+        retry.assert_called_once()
+        self.assertEqual(self.member.subscriptions.count(), 1)
+
+    @override_settings(MEMBERSHIP_PAYMENT_MAX_ATTEMPTS=1)
+    @mock.patch.object(Payment, "retry")
+    def test_renewal_abandons_after_max_attempts(self, retry):
+        self.assertFalse(self.member.membership.renew_subscription())
+        retry.assert_not_called()
+
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.ABANDONED)
+        self.assertFalse(Membership.objects.get(member=self.member).is_active)
+        self.assertEqual(self.member.subscriptions.count(), 1)
+
+    @mock.patch.object(Payment, "retry")
+    def test_renewal_abandons_after_retry_days(self, retry):
+        Payment.objects.filter(id=self.payment.id).update(
+            created_on=timezone.now() - timedelta(days=3)
+        )
+
+        self.assertFalse(self.member.membership.renew_subscription())
+        retry.assert_not_called()
+        self.payment.refresh_from_db()
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.ABANDONED)
+
+    @mock.patch.object(Payment, "retry")
+    def test_renewal_ignores_failure_of_older_subscription(self, retry):
+        # 이전 구독의 실패한 결제는 최근 구독의 갱신을 막지 않는다.
+        Subscription.create_subscription(
+            member=self.member,
+            started_at=timezone.now() - timedelta(days=1),
+            ended_at=timezone.now() - timedelta(hours=1),
+        )
+
+        self.assertTrue(self.member.membership.renew_subscription())
+        retry.assert_not_called()
+        self.assertEqual(self.member.subscriptions.count(), 3)
+
+
+class ExecutePendingPaymentsTest(TestCase):
+    @mock.patch(
+        "ggongsul.membership.management.commands.execute_pending_payments"
+        ".execute_payment.delay"
+    )
+    def test_enqueue_old_pending_payments(self, delay):
+        member = create_member()
+        old, recent, paid = [
+            create_payment(
+                Subscription.create_subscription(
+                    member=member, started_at=timezone.now()
+                ),
+                status=status,
+            )
+            for status in (
+                Payment.PaymentStatus.PENDING,
+                Payment.PaymentStatus.PENDING,
+                Payment.PaymentStatus.PAID,
+            )
+        ]
+        Payment.objects.filter(id__in=[old.id, paid.id]).update(
+            created_on=timezone.now() - timedelta(minutes=30)
+        )
+
+        call_command("execute_pending_payments", stdout=mock.MagicMock())
+        delay.assert_called_once_with(old.id)
@@ -4,7 +4,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.contrib import admin
 
-from ggongsul.lib.kakao import KakaoApiHelper
+from ggongsul.common.geocode import cached_search_address
 
 from .models import Partner, PartnerDetail, PartnerCategory, PartnerAgreement
 
@@ -51,9 +51,7 @@ class PartnerForm(forms.ModelForm):
         return is_active
 
     def save(self, commit=True):
-        helper = KakaoApiHelper()
-
-        res: dict = helper.search_address(self.instance.address)
+        res: dict = cached_search_address(self.instance.address)
         logger.debug(res)
 
         # 정확히 주소가 맞을때만 입력
@@ -75,6 +73,7 @@ class PartnerAdmin(admin.ModelAdmin):
     inlines = [PartnerAgreementInline, PartnerDetailInline]
     exclude = ("longitude", "latitude")
     list_filter = ("is_active",)
+    list_select_related = ("detail", "agreement")
     search_fields = ("name", "contact_name")
     list_display = (
         "name",
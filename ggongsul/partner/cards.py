@@ -0,0 +1,85 @@
+import logging
+
+from typing import Callable, Dict, Iterable, List
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+
+from ggongsul.common.cache import TieredCache
+from ggongsul.core.renderers import ORJSONRenderer
+
+from .models import Partner
+from .projections import map_info_rows, short_info_rows
+from .serializers import PartnerMapInfoSerializer, PartnerShortInfoSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class PartnerCardCache:
+    """
+    Compact JSON of a partner list item, kept per partner id so that list
+    responses are assembled from fragments instead of serializing rows.
+    """
+
+    def __init__(self, name: str, project: Callable[[QuerySet], List[dict]]):
+        self.project = project
+        # 응답 형식이 바뀌면 이름의 버전을 올려서 이전 배포의 캐시를 무시한다.
+        self.cache = TieredCache(
+            f"partner.card.{name}.v1",
+            max_size=settings.PARTNER_CARD_CACHE_MAX_SIZE,
+            ttl=settings.PARTNER_CARD_CACHE_TTL,
+            local_ttl=settings.PARTNER_CARD_CACHE_LOCAL_TTL,
+        )
+        self.renderer = ORJSONRenderer()
+
+    def build(self, partner_ids: Iterable[int]) -> Dict[int, bytes]:
+        rows = self.project(Partner.objects.filter(id__in=partner_ids))
+        cards = {row["id"]: self.renderer.render(row) for row in rows}
+        self.cache.set_many({str(k): v for k, v in cards.items()})
+        return cards
+
+    def get_map(self, partner_ids: List[int]) -> Dict[int, bytes]:
+        """
+        Returns the cards of partner_ids by id, building the missing ones
+        with a single query.
+        """
+        cached = self.cache.get_many([str(partner_id) for partner_id in partner_ids])
+        cards = {int(k): v for k, v in cached.items()}
+
+        missing = [partner_id for partner_id in partner_ids if partner_id not in cards]
+        if missing:
+            cards.update(self.build(missing))
+        return cards
+
+    def get_many(self, partner_ids: List[int]) -> List[bytes]:
+        cards = self.get_map(partner_ids)
+        return [cards[partner_id] for partner_id in partner_ids if partner_id in cards]
+
+    def invalidate(self, partner_ids: Iterable[int]):
+        for partner_id in partner_ids:
+            self.cache.delete(str(partner_id))
+
+
+short_cards = PartnerCardCache("short", short_info_rows)
+map_cards = PartnerCardCache("map", map_info_rows)
+
+CARD_CACHES = {
+    PartnerShortInfoSerializer: short_cards,
+    PartnerMapInfoSerializer: map_cards,
+}
+
+
+def join_cards(cards: List[bytes]) -> bytes:
+    return b"[" + b",".join(cards) + b"]"
+
+
+def invalidate_partner_cards(partner_ids: Iterable[int]):
+    partner_ids = list(partner_ids)
+
+    def invalidate():
+        for cards in CARD_CACHES.values():
+            cards.invalidate(partner_ids)
+
+    # commit 전에 이전 정보를 읽은 요청이 다시 캐시하지 않도록 commit 이후에 지운다.
+    transaction.on_commit(invalidate)
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db.models import Case, IntegerField, When
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from .search_index import get_search_index
+
+
+class PartnerSearchFilterBackend(filters.BaseFilterBackend):
+    """
+    Filters partners by the search index instead of `LIKE '%q%'`, ordered by
+    relevance.
+    """
+
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+
+        partner_ids = get_search_index().search(
+            query, limit=settings.PARTNER_SEARCH_MAX_RESULTS
+        )
+        if not partner_ids:
+            return queryset.none()
+
+        rank = Case(
+            *[When(id=pk, then=i) for i, pk in enumerate(partner_ids)],
+            output_field=IntegerField(),
+        )
+        return queryset.filter(id__in=partner_ids).order_by(rank)
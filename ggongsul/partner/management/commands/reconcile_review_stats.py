@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from ggongsul.core.mixins import bump_response_version
+from ggongsul.partner.models import Partner
+from ggongsul.review.models import Review
+
+
+def _aggregate_review_stats(partner_ids=None) -> dict:
+    queryset = Review.objects.filter(is_deleted=False, partner__isnull=False)
+    if partner_ids is not None:
+        queryset = queryset.filter(partner__in=partner_ids)
+
+    stats = queryset.values("partner").annotate(
+        cnt=Count("id"), rating_sum=Sum("rating_score")
+    )
+    return {row["partner"]: (row["cnt"], row["rating_sum"]) for row in stats}
+
+
+class Command(BaseCommand):
+    help = "Recomputes the review stats of partners and fixes the drifted ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only reports the drifted partners.",
+        )
+
+    def handle(self, *args, **options):
+        stats = _aggregate_review_stats()
+
+        drifted_ids = []
+        partners = Partner.objects.only("id", *Partner.COUNTER_FIELDS)
+        for partner in partners.iterator():
+            expected = stats.get(partner.id, (0, 0))
+            if (partner.review_count, partner.review_rating_sum) != expected:
+                drifted_ids.append(partner.id)
+
+        self.stdout.write(f"drifted partner count: {len(drifted_ids)}")
+        if options["dry_run"] or not drifted_ids:
+            return
+
+        for partner_id in drifted_ids:
+            # 업체 row 를 잠근 뒤 다시 계산해서 동시에 들어온 리뷰 갱신과 충돌하지 않도록 한다.
+            with transaction.atomic():
+                Partner.objects.select_for_update().filter(pk=partner_id).first()
+                cnt, rating_sum = _aggregate_review_stats([partner_id]).get(
+                    partner_id, (0, 0)
+                )
+                Partner.objects.filter(pk=partner_id).update(
+                    review_count=cnt, review_rating_sum=rating_sum
+                )
+
+        bump_response_version("partner")
+        self.stdout.write(
+            self.style.SUCCESS(f"reconciled partner count: {len(drifted_ids)}")
+        )
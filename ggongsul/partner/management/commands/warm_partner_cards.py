@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from ggongsul.partner.cards import CARD_CACHES
+from ggongsul.partner.models import Partner
+
+
+class Command(BaseCommand):
+    help = "Builds the cached cards of every active partner."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of partners serialized per query.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        partner_ids = list(
+            Partner.objects.filter(is_active=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        for cards in CARD_CACHES.values():
+            for i in range(0, len(partner_ids), chunk_size):
+                cards.build(partner_ids[i : i + chunk_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"warmed {len(CARD_CACHES)} card caches of {len(partner_ids)} partners"
+            )
+        )
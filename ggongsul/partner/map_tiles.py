@@ -0,0 +1,130 @@
+import math
+
+from collections import defaultdict
+from typing import List, Tuple
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+from ggongsul.common.cache import MISSING
+
+from .projections import format_latitude, format_longitude
+from .spatial_index import PartnerPoint, PartnerSpatialIndex, get_partner_index
+
+# web mercator 로 표현할 수 있는 위도의 범위
+MAX_LATITUDE = 85.05112878
+
+
+def lng_to_tile_x(lng: float, zoom: int) -> float:
+    return (lng + 180) / 360 * 2 ** zoom
+
+
+def lat_to_tile_y(lat: float, zoom: int) -> float:
+    lat = max(min(lat, MAX_LATITUDE), -MAX_LATITUDE)
+    lat_rad = math.radians(lat)
+    y = (1 - math.asinh(math.tan(lat_rad)) / math.pi) / 2
+    return y * 2 ** zoom
+
+
+def tile_bounds(x: int, y: int, zoom: int) -> Tuple[float, float, float, float]:
+    """
+    Returns (min_lat, max_lat, min_lng, max_lng) of the tile.
+    """
+    n = 2 ** zoom
+
+    def tile_lat(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return tile_lat(y + 1), tile_lat(y), x / n * 360 - 180, (x + 1) / n * 360 - 180
+
+
+def viewport_tiles(
+    min_lat: float, max_lat: float, min_lng: float, max_lng: float, zoom: int
+) -> List[Tuple[int, int]]:
+    last = 2 ** zoom - 1
+
+    def clamp(v: float) -> int:
+        return max(0, min(int(v), last))
+
+    lo_x = clamp(lng_to_tile_x(min_lng, zoom))
+    hi_x = clamp(lng_to_tile_x(max_lng, zoom))
+    # tile 의 y 는 북쪽에서부터 증가한다.
+    lo_y = clamp(lat_to_tile_y(max_lat, zoom))
+    hi_y = clamp(lat_to_tile_y(min_lat, zoom))
+
+    return [(x, y) for x in range(lo_x, hi_x + 1) for y in range(lo_y, hi_y + 1)]
+
+
+def map_pin(point: PartnerPoint) -> dict:
+    # PartnerMapInfoSerializer 와 같은 형식으로 응답한다.
+    return {
+        "id": point.id,
+        "name": point.name,
+        "longitude": format_longitude(point.longitude),
+        "latitude": format_latitude(point.latitude),
+        "offer_type": point.offer_type,
+    }
+
+
+def build_tile(index: PartnerSpatialIndex, zoom: int, x: int, y: int) -> dict:
+    points = []
+    grid = settings.PARTNER_MAP_TILE_GRID
+    cells = defaultdict(list)
+
+    for p in index.in_box(*tile_bounds(x, y, zoom)):
+        px, py = lng_to_tile_x(p.longitude, zoom), lat_to_tile_y(p.latitude, zoom)
+        # 경계에 놓인 업체가 두 tile 에 중복되지 않도록 좌표로 tile 을 다시 정한다.
+        if (min(int(px), 2 ** zoom - 1), min(int(py), 2 ** zoom - 1)) != (x, y):
+            continue
+
+        if zoom >= settings.PARTNER_MAP_CLUSTER_MAX_ZOOM:
+            points.append(p)
+        else:
+            cells[int(px * grid), int(py * grid)].append(p)
+
+    clusters = []
+    for cell_points in cells.values():
+        if len(cell_points) == 1:
+            points.extend(cell_points)
+            continue
+
+        cnt = len(cell_points)
+        clusters.append(
+            {
+                "count": cnt,
+                "latitude": round(sum(p.latitude for p in cell_points) / cnt, 6),
+                "longitude": round(sum(p.longitude for p in cell_points) / cnt, 6),
+            }
+        )
+
+    return {"clusters": clusters, "partners": [map_pin(p) for p in points]}
+
+
+def get_tile(index: PartnerSpatialIndex, zoom: int, x: int, y: int) -> dict:
+    key = f"{zoom}/{x}/{y}"
+    tile = index.tiles.get(key)
+    if tile is MISSING:
+        tile = build_tile(index, zoom, x, y)
+        index.tiles.set(key, tile)
+    return tile
+
+
+def viewport_clusters(
+    min_lat: float, max_lat: float, min_lng: float, max_lng: float, zoom: int
+) -> dict:
+    """
+    Returns the clusters and the single partners of the tiles covering the
+    viewport at zoom.
+    """
+    tiles = viewport_tiles(min_lat, max_lat, min_lng, max_lng, zoom)
+    if len(tiles) > settings.PARTNER_MAP_MAX_TILES:
+        raise ValidationError({"msg": "viewport is too large for the zoom level!"})
+
+    index = get_partner_index()
+    clusters, partners = [], []
+    for x, y in tiles:
+        tile = get_tile(index, zoom, x, y)
+        clusters.extend(tile["clusters"])
+        partners.extend(tile["partners"])
+
+    return {"zoom": zoom, "clusters": clusters, "partners": partners}
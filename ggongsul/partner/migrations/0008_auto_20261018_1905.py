@@ -0,0 +1,19 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("partner", "0007_partner_cert_num"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="partner",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="partner_par_latitud_dae7a3_idx"
+            ),
+        ),
+    ]
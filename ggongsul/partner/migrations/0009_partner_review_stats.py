@@ -0,0 +1,45 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:08
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def fill_review_stats(apps, schema_editor):
+    Partner = apps.get_model("partner", "Partner")
+    Review = apps.get_model("review", "Review")
+
+    stats = (
+        Review.objects.filter(is_deleted=False, partner__isnull=False)
+        .values("partner")
+        .annotate(cnt=Count("id"), rating_sum=Sum("rating_score"))
+    )
+    for row in stats:
+        Partner.objects.filter(pk=row["partner"]).update(
+            review_count=row["cnt"], review_rating_sum=row["rating_sum"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("partner", "0008_auto_20261018_1905"),
+        ("review", "0004_auto_20210116_2145"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="partner",
+            name="review_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="전체 리뷰 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="partner",
+            name="review_rating_sum",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="리뷰 별점 합계"
+            ),
+        ),
+        migrations.RunPython(fill_review_stats, migrations.RunPython.noop),
+    ]
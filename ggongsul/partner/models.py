@@ -5,13 +5,15 @@ import secrets
 import uuid
 import logging
 
-from django.db import models
+from django.db import models, transaction
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
-from django.db.models import Avg
+from django.db.models import F
 
+from ggongsul.common.counters import CounterFieldsMixin
 from ggongsul.core.exceptions import CommError
+from ggongsul.core.mixins import bump_response_version
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +31,7 @@ class PathAndRename:
         return os.path.join(self.path, renamed_filename)
 
 
-class Partner(models.Model):
+class Partner(CounterFieldsMixin, models.Model):
     detail: PartnerDetail
     agreement: PartnerAgreement
 
@@ -50,12 +52,23 @@ class Partner(models.Model):
         max_digits=8, decimal_places=6, null=True, verbose_name=_("위도")
     )
 
+    # 삭제되지 않은 리뷰의 통계로, 리뷰 저장 시 F() 로만 갱신된다.
+    review_count = models.IntegerField(
+        default=0, editable=False, verbose_name=_("전체 리뷰 수")
+    )
+    review_rating_sum = models.IntegerField(
+        default=0, editable=False, verbose_name=_("리뷰 별점 합계")
+    )
+
     created_on = models.DateTimeField(auto_now_add=True, verbose_name=_("생성 날짜"))
     updated_on = models.DateTimeField(auto_now=True, verbose_name=_("최근 정보 변경 날짜"))
 
+    COUNTER_FIELDS = ("review_count", "review_rating_sum")
+
     class Meta:
         verbose_name = _("업체 정보")
         verbose_name_plural = _("업체 정보")
+        indexes = [models.Index(fields=["latitude", "longitude"])]
 
     def __str__(self):
         return self.name
@@ -63,16 +76,24 @@ class Partner(models.Model):
     def __repr__(self):
         return self.__str__()
 
+    @classmethod
+    def add_review_stats(cls, partner_id: int, count: int, rating_sum: int):
+        cls.objects.filter(pk=partner_id).update(
+            review_count=F("review_count") + count,
+            review_rating_sum=F("review_rating_sum") + rating_sum,
+        )
+        # update() 는 updated_on 을 바꾸지 않으므로 캐싱된 업체 응답을 직접 무효화한다.
+        transaction.on_commit(lambda: bump_response_version("partner"))
+
     def avg_review_rating(self) -> float:
-        aggregated = self.reviews.all().aggregate(Avg("rating_score"))[
-            "rating_score__avg"
-        ]
-        return aggregated if aggregated else 0.0
+        if not self.review_count:
+            return 0.0
+        return self.review_rating_sum / self.review_count
 
     avg_review_rating.short_description = _("리뷰 평점")
 
     def total_review_cnt(self) -> int:
-        return len(self.reviews.all())
+        return self.review_count
 
     total_review_cnt.short_description = _("전체 리뷰 수")
 
@@ -0,0 +1,52 @@
+from typing import List
+
+from django.db.models import QuerySet
+
+from ggongsul.core.projections import decimal_formatter, file_url_getter
+
+from .models import Partner, PartnerDetail
+
+# PartnerMapInfoSerializer, PartnerShortInfoSerializer 와 같은 결과를 values() 로 만든다.
+
+format_longitude = decimal_formatter(Partner._meta.get_field("longitude"))
+format_latitude = decimal_formatter(Partner._meta.get_field("latitude"))
+img_main_url = file_url_getter(PartnerDetail._meta.get_field("img_main"))
+
+MAP_INFO_FIELDS = ("id", "name", "longitude", "latitude", "detail__offer_type")
+SHORT_INFO_FIELDS = (
+    "id",
+    "name",
+    "address",
+    "detail__short_desc",
+    "detail__offer_type",
+    "detail__img_main",
+    "detail__category__name",
+)
+
+
+def map_info_rows(queryset: QuerySet) -> List[dict]:
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "longitude": format_longitude(row["longitude"]),
+            "latitude": format_latitude(row["latitude"]),
+            "offer_type": row["detail__offer_type"],
+        }
+        for row in queryset.values(*MAP_INFO_FIELDS)
+    ]
+
+
+def short_info_rows(queryset: QuerySet) -> List[dict]:
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "address": row["address"],
+            "short_desc": row["detail__short_desc"],
+            "offer_type": row["detail__offer_type"],
+            "img_main": img_main_url(row["detail__img_main"]),
+            "category": row["detail__category__name"],
+        }
+        for row in queryset.values(*SHORT_INFO_FIELDS)
+    ]
@@ -0,0 +1,88 @@
+import datetime
+
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from .search_index import get_search_index
+from .spatial_index import PartnerPoint, get_partner_index
+
+
+def is_open_at(point: PartnerPoint, at: datetime.time) -> bool:
+    """
+    Returns whether the partner is open at `at`. Partners without business
+    hours are regarded as closed.
+    """
+    if point.open_time is None or point.end_time is None:
+        return False
+
+    # 자정을 넘겨서 영업하는 경우 (ex. 18:00 ~ 02:00)
+    if point.end_time <= point.open_time:
+        return at >= point.open_time or at < point.end_time
+    return point.open_time <= at < point.end_time
+
+
+def search_partners(
+    lat: float = None,
+    lng: float = None,
+    radius_km: float = None,
+    query: str = None,
+    category: str = None,
+    offer_type: int = None,
+    open_at: datetime.time = None,
+    limit: int = None,
+) -> dict:
+    """
+    Searches the partners with the spatial and the text index in one pass.
+
+    Results are ordered by distance when lat/lng is given, by relevance when
+    only a query is given and by id otherwise. A facet is counted with every
+    filter but its own, so that the client can show how many partners each
+    choice would leave.
+    """
+    if lat is not None:
+        found = get_partner_index().within(lat, lng, radius_km)
+    else:
+        found = [(None, point) for point in get_partner_index()]
+
+    rank = None
+    if query:
+        ranked_ids = get_search_index().search(query)
+        rank = {pk: i for i, pk in enumerate(ranked_ids)}
+
+    results: List[Tuple[Optional[float], PartnerPoint]] = []
+    category_counts, offer_type_counts = Counter(), Counter()
+    for distance, point in found:
+        if rank is not None and point.id not in rank:
+            continue
+        if open_at is not None and not is_open_at(point, open_at):
+            continue
+
+        category_matched = category is None or point.category == category
+        offer_type_matched = offer_type is None or point.offer_type == offer_type
+        if offer_type_matched and point.category is not None:
+            category_counts[point.category] += 1
+        if category_matched:
+            offer_type_counts[point.offer_type] += 1
+        if category_matched and offer_type_matched:
+            results.append((distance, point))
+
+    if lat is None:
+        if rank is not None:
+            results.sort(key=lambda r: rank[r[1].id])
+        else:
+            results.sort(key=lambda r: r[1].id)
+
+    return {
+        "count": len(results),
+        "facets": {
+            "category": [
+                {"name": name, "count": cnt}
+                for name, cnt in category_counts.most_common()
+            ],
+            "offer_type": [
+                {"offer_type": value, "count": cnt}
+                for value, cnt in offer_type_counts.most_common()
+            ],
+        },
+        "results": [point.payload for _, point in results[:limit]],
+    }
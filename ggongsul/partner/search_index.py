@@ -0,0 +1,260 @@
+import logging
+import math
+import threading
+import time
+
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from operator import add
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from ggongsul.common.hangul import (
+    is_chosung_only,
+    ngrams,
+    to_chosung,
+    to_jamo,
+    words,
+)
+
+logger = logging.getLogger(__name__)
+
+# 검색 대상 필드와 가중치
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "detail__category__name": 2.0,
+    "detail__short_desc": 1.5,
+    "address": 1.0,
+    "detail__detail_desc": 0.5,
+}
+# 한 글자 검색어는 업체명과 카테고리에서만 찾으며, unigram 은 bigram 보다 낮은 가중치로 색인한다.
+UNIGRAM_FIELDS = ("name", "detail__category__name")
+UNIGRAM_WEIGHT = 0.5
+# 업체명에 검색어가 그대로 포함되어 있으면 점수를 더한다.
+NAME_MATCH_BONUS = 10.0
+
+
+def document_grams(doc: dict) -> Dict[str, float]:
+    grams = defaultdict(float)
+    for field, weight in FIELD_WEIGHTS.items():
+        counts = Counter()
+        for word in words(doc.get(field)):
+            counts.update(map(add, word, word[1:]))
+            if field in UNIGRAM_FIELDS:
+                counts.update(word)
+
+        for gram, cnt in counts.items():
+            grams[gram] += weight * cnt * (UNIGRAM_WEIGHT if len(gram) == 1 else 1)
+    return grams
+
+
+def query_grams(query: str) -> List[str]:
+    grams = set()
+    for word in words(query):
+        grams.update(ngrams(word) if len(word) > 1 else [word])
+    return list(grams)
+
+
+def name_keys(name: str) -> List[Tuple[str, int]]:
+    """
+    Returns (key, word position) pairs of the name, one per word suffix, so
+    that "을지로 맥주" is found by both "을지" and "맥주".
+    """
+    name_words = words(name)
+    return [("".join(name_words[i:]), i) for i in range(len(name_words))]
+
+
+class PartnerSearchIndex:
+    """
+    Inverted index of the bigrams of active partners, which ranks full text
+    matches and completes partially typed hangul names.
+    """
+
+    def __init__(self, docs: Iterable[dict]):
+        self.built_at = time.monotonic()
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._doc_grams: Dict[int, Dict[str, float]] = {}
+        self._names: Dict[int, str] = {}
+        # (자모로 풀어쓴 key, 단어 위치, 업체 id) 를 정렬해둔 목록
+        self._jamo_keys: List[Tuple[str, int, int]] = []
+        self._chosung_keys: List[Tuple[str, int, int]] = []
+
+        for doc in docs:
+            self._add(doc, sort=False)
+        self._jamo_keys.sort()
+        self._chosung_keys.sort()
+
+    def __len__(self):
+        return len(self._doc_grams)
+
+    def _add(self, doc: dict, sort: bool = True):
+        doc_id = doc["id"]
+        grams = document_grams(doc)
+        for gram, weight in grams.items():
+            self._postings[gram][doc_id] = weight
+        self._doc_grams[doc_id] = grams
+        self._names[doc_id] = doc["name"]
+
+        add = insort if sort else list.append
+        for key, pos in name_keys(doc["name"]):
+            add(self._jamo_keys, (to_jamo(key), pos, doc_id))
+            add(self._chosung_keys, (to_chosung(key), pos, doc_id))
+
+    def _remove(self, doc_id: int):
+        grams = self._doc_grams.pop(doc_id, None)
+        if grams is None:
+            return
+
+        for gram in grams:
+            postings = self._postings[gram]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[gram]
+
+        name = self._names.pop(doc_id)
+        for key, pos in name_keys(name):
+            for keys, entry in (
+                (self._jamo_keys, (to_jamo(key), pos, doc_id)),
+                (self._chosung_keys, (to_chosung(key), pos, doc_id)),
+            ):
+                i = bisect_left(keys, entry)
+                if i < len(keys) and keys[i] == entry:
+                    del keys[i]
+
+    def upsert(self, docs: Iterable[dict]):
+        with self._lock:
+            for doc in docs:
+                self._remove(doc["id"])
+                self._add(doc)
+
+    def remove(self, doc_ids: Iterable[int]):
+        with self._lock:
+            for doc_id in doc_ids:
+                self._remove(doc_id)
+
+    def search(self, query: str, limit: int = None) -> List[int]:
+        """
+        Returns the ids of partners containing every bigram of the query,
+        best match first.
+        """
+        grams = query_grams(query)
+        if not grams:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(gram, {}) for gram in grams]
+            # 가장 짧은 posting 부터 교집합을 구한다.
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+            n = len(self._doc_grams)
+            idf = [math.log(1 + n / len(posting)) for posting in postings]
+            phrase = "".join(words(query))
+            scores = {}
+            for doc_id in candidates:
+                score = sum(w * posting[doc_id] for w, posting in zip(idf, postings))
+                if phrase in "".join(words(self._names[doc_id])):
+                    score += NAME_MATCH_BONUS
+                scores[doc_id] = score
+
+        ranked = sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))
+        return ranked[:limit]
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """
+        Returns (id, name) of partners whose name has a word starting with
+        prefix. A prefix made only of initial consonants ("ㅁㅈ") matches by
+        chosung.
+        """
+        prefix = "".join(words(prefix))
+        if not prefix:
+            return []
+
+        if is_chosung_only(prefix):
+            keys = self._chosung_keys
+        else:
+            keys, prefix = self._jamo_keys, to_jamo(prefix)
+
+        found = {}
+        with self._lock:
+            i = bisect_left(keys, (prefix,))
+            while i < len(keys) and keys[i][0].startswith(prefix):
+                _, pos, doc_id = keys[i]
+                found[doc_id] = min(pos, found.get(doc_id, pos))
+                i += 1
+            names = {doc_id: self._names[doc_id] for doc_id in found}
+
+        # 업체명의 첫 단어부터 일치하는 업체, 짧은 업체명 순으로 보여준다.
+        ranked = sorted(
+            found, key=lambda doc_id: (found[doc_id] > 0, len(names[doc_id]), doc_id)
+        )
+        return [(doc_id, names[doc_id]) for doc_id in ranked[:limit]]
+
+
+def fetch_documents(partner_ids: Iterable[int] = None) -> List[dict]:
+    from .models import Partner
+
+    queryset = Partner.objects.filter(is_active=True)
+    if partner_ids is not None:
+        queryset = queryset.filter(id__in=partner_ids)
+    return list(queryset.values("id", *FIELD_WEIGHTS))
+
+
+def build_search_index() -> PartnerSearchIndex:
+    index = PartnerSearchIndex(fetch_documents())
+    logger.info(f"partner search index is built with {len(index)} partners")
+    return index
+
+
+_index: Optional[PartnerSearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def _is_fresh(index: Optional[PartnerSearchIndex]) -> bool:
+    if index is None:
+        return False
+    return time.monotonic() - index.built_at < settings.PARTNER_SEARCH_INDEX_TTL
+
+
+def get_search_index() -> PartnerSearchIndex:
+    """
+    Returns the partner search index of this worker, building it lazily.
+    """
+    global _index
+
+    index = _index
+    if _is_fresh(index):
+        return index
+
+    with _index_lock:
+        if not _is_fresh(_index):
+            _index = build_search_index()
+        return _index
+
+
+def update_partner_search(partner_ids: Iterable[int]):
+    """
+    Re-indexes the partners of this worker's index after the transaction is
+    committed. Other workers catch up when their index expires.
+    """
+    partner_ids = set(partner_ids)
+
+    def update():
+        index = _index
+        if index is None or not partner_ids:
+            return
+
+        docs = fetch_documents(partner_ids)
+        index.remove(partner_ids - {doc["id"] for doc in docs})
+        index.upsert(docs)
+
+    transaction.on_commit(update)
@@ -37,6 +37,10 @@ class PartnerAgreementSerializer(serializers.Serializer):
 class PartnerMapInfoSerializer(serializers.ModelSerializer):
     offer_type = serializers.IntegerField(source="detail.offer_type")
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related("detail")
+
     class Meta:
         model = Partner
         fields = ["id", "name", "longitude", "latitude", "offer_type"]
@@ -48,6 +52,10 @@ class PartnerShortInfoSerializer(serializers.ModelSerializer):
     img_main = serializers.CharField(source="detail.img_main.url")
     category = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related("detail__category")
+
     def get_category(self, obj: Partner):
         if obj.detail.category is None:
             return None
@@ -82,6 +90,10 @@ class PartnerDetailInfoSerializer(serializers.ModelSerializer):
     img_menu_list = serializers.SerializerMethodField(read_only=True)
     img_price_list = serializers.SerializerMethodField(read_only=True)
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related("detail__category")
+
     def get_img_store_list(self, obj: Partner) -> List[str]:
         img_store_list = []
         detail = obj.detail
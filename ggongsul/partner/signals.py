@@ -1,10 +1,58 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
 
-from .models import Partner, PartnerDetail
+from ggongsul.core.mixins import bump_response_version
+
+from .cards import invalidate_partner_cards
+from .models import Partner, PartnerDetail, PartnerCategory
+from .search_index import update_partner_search
+from .spatial_index import invalidate_partner_index
 
 
 @receiver(post_save, sender=Partner)
 def create_profile(sender, instance, created, **kwargs):
     if created:
         PartnerDetail.objects.create(partner=instance)
+
+
+# 업체 카드는 index, 응답 캐시가 다시 만들어질 때 사용되므로 먼저 무효화한다.
+# 검색 index 는 전체를 다시 만들지 않고 변경된 업체만 다시 색인한다.
+@receiver(post_save, sender=Partner)
+@receiver(post_delete, sender=Partner)
+def invalidate_partner_card(sender, instance: Partner, **kwargs):
+    invalidate_partner_cards([instance.id])
+    update_partner_search([instance.id])
+
+
+@receiver(post_save, sender=PartnerDetail)
+def invalidate_detail_card(sender, instance: PartnerDetail, **kwargs):
+    invalidate_partner_cards([instance.partner_id])
+    update_partner_search([instance.partner_id])
+
+
+# 카테고리 삭제 시 연결이 끊어지기 전에 업체 목록을 구한다.
+@receiver(post_save, sender=PartnerCategory)
+@receiver(pre_delete, sender=PartnerCategory)
+def invalidate_category_cards(sender, instance: PartnerCategory, **kwargs):
+    partner_ids = list(instance.partners.values_list("partner_id", flat=True))
+    invalidate_partner_cards(partner_ids)
+    update_partner_search(partner_ids)
+
+
+@receiver(post_save, sender=Partner)
+@receiver(post_delete, sender=Partner)
+@receiver(post_save, sender=PartnerDetail)
+@receiver(post_save, sender=PartnerCategory)
+@receiver(post_delete, sender=PartnerCategory)
+def invalidate_spatial_index(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_partner_index)
+
+
+@receiver(post_save, sender=Partner)
+@receiver(post_delete, sender=Partner)
+@receiver(post_save, sender=PartnerDetail)
+@receiver(post_save, sender=PartnerCategory)
+@receiver(post_delete, sender=PartnerCategory)
+def invalidate_partner_responses(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_response_version("partner"))
@@ -0,0 +1,229 @@
+import datetime
+import json
+import logging
+import math
+import threading
+import time
+
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+from ggongsul.common.cache import LRUCache
+from ggongsul.common.geo import haversine, bounding_box
+
+logger = logging.getLogger(__name__)
+
+# 지구 둘레의 절반, 이보다 먼 점은 존재하지 않는다.
+MAX_DISTANCE_KM = 20016
+
+
+class PartnerPoint(NamedTuple):
+    id: int
+    name: str
+    latitude: float
+    longitude: float
+    offer_type: int
+    category: Optional[str]
+    open_time: Optional[datetime.time]
+    end_time: Optional[datetime.time]
+    payload: dict
+    card: bytes
+
+
+class PartnerSpatialIndex:
+    """
+    Uniform grid of active partners which answers radius and k-nearest
+    queries without touching the database.
+    """
+
+    def __init__(
+        self,
+        points: List[PartnerPoint],
+        cell_size: float = 0.05,
+        tile_cache_size: int = 1024,
+    ):
+        self.cell_size = cell_size
+        self.built_at = time.monotonic()
+        # 지도 tile 별 cluster 결과로, index 가 다시 만들어지면 함께 버려진다.
+        self.tiles = LRUCache(tile_cache_size, ttl=math.inf)
+        self._points = points
+        self._cells: Dict[Tuple[int, int], List[PartnerPoint]] = defaultdict(list)
+
+        for p in points:
+            self._cells[self._cell_of(p.latitude, p.longitude)].append(p)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __iter__(self):
+        return iter(self._points)
+
+    def _cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def _candidate_cells(self, lat: float, lng: float, radius_km: float):
+        return self._cells_in_box(*bounding_box(lat, lng, radius_km))
+
+    def _cells_in_box(
+        self, min_lat: float, max_lat: float, min_lng: float, max_lng: float
+    ):
+        lo_lat, lo_lng = self._cell_of(min_lat, min_lng)
+        hi_lat, hi_lng = self._cell_of(max_lat, max_lng)
+
+        # 검색 범위가 채워진 셀 수보다 넓으면 채워진 셀만 훑는다.
+        if (hi_lat - lo_lat + 1) * (hi_lng - lo_lng + 1) > len(self._cells):
+            for (c_lat, c_lng), points in self._cells.items():
+                if lo_lat <= c_lat <= hi_lat and lo_lng <= c_lng <= hi_lng:
+                    yield points
+            return
+
+        for c_lat in range(lo_lat, hi_lat + 1):
+            for c_lng in range(lo_lng, hi_lng + 1):
+                points = self._cells.get((c_lat, c_lng))
+                if points:
+                    yield points
+
+    def in_box(
+        self, min_lat: float, max_lat: float, min_lng: float, max_lng: float
+    ) -> List[PartnerPoint]:
+        """
+        Returns the points inside the box, boundaries included.
+        """
+        return [
+            p
+            for points in self._cells_in_box(min_lat, max_lat, min_lng, max_lng)
+            for p in points
+            if min_lat <= p.latitude <= max_lat and min_lng <= p.longitude <= max_lng
+        ]
+
+    def within(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        offer_type: int = None,
+        category: str = None,
+    ) -> List[Tuple[float, PartnerPoint]]:
+        """
+        Returns (distance, point) pairs closer than radius_km, nearest first.
+        """
+        result = []
+        for points in self._candidate_cells(lat, lng, radius_km):
+            for p in points:
+                if offer_type is not None and p.offer_type != offer_type:
+                    continue
+                if category is not None and p.category != category:
+                    continue
+
+                distance = haversine(lat, lng, p.latitude, p.longitude)
+                if distance < radius_km:
+                    result.append((distance, p))
+
+        result.sort(key=lambda r: (r[0], r[1].id))
+        return result
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int,
+        max_radius_km: float = None,
+        offer_type: int = None,
+        category: str = None,
+    ) -> List[Tuple[float, PartnerPoint]]:
+        """
+        Returns the k nearest (distance, point) pairs, optionally bounded by
+        max_radius_km.
+        """
+        limit = min(max_radius_km or MAX_DISTANCE_KM, MAX_DISTANCE_KM)
+        radius = min(1.0, limit)
+
+        while True:
+            found = self.within(lat, lng, radius, offer_type, category)
+            # radius 안에 k 개 이상이 있으면 그 중 가까운 k 개가 전체에서도 가장 가깝다.
+            if len(found) >= k or radius >= limit:
+                return found[:k]
+            radius = min(radius * 2, limit)
+
+
+def build_partner_index() -> PartnerSpatialIndex:
+    from .cards import short_cards
+    from .models import Partner
+
+    rows = list(
+        Partner.objects.filter(
+            is_active=True, latitude__isnull=False, longitude__isnull=False
+        ).values(
+            "id",
+            "name",
+            "latitude",
+            "longitude",
+            "detail__offer_type",
+            "detail__category__name",
+            "detail__open_time",
+            "detail__end_time",
+        )
+    )
+    # 다시 만들 때마다 직렬화하지 않도록 캐싱된 업체 카드를 사용한다.
+    cards = short_cards.get_map([row["id"] for row in rows])
+
+    points = []
+    for row in rows:
+        card = cards.get(row["id"])
+        if card is None:
+            continue
+
+        points.append(
+            PartnerPoint(
+                id=row["id"],
+                name=row["name"],
+                latitude=float(row["latitude"]),
+                longitude=float(row["longitude"]),
+                offer_type=row["detail__offer_type"],
+                category=row["detail__category__name"],
+                open_time=row["detail__open_time"],
+                end_time=row["detail__end_time"],
+                payload=json.loads(card),
+                card=card,
+            )
+        )
+
+    logger.info(f"partner spatial index is built with {len(points)} partners")
+    return PartnerSpatialIndex(
+        points,
+        cell_size=settings.PARTNER_INDEX_CELL_SIZE,
+        tile_cache_size=settings.PARTNER_MAP_TILE_CACHE_SIZE,
+    )
+
+
+_index: Optional[PartnerSpatialIndex] = None
+_index_lock = threading.Lock()
+
+
+def _is_fresh(index: Optional[PartnerSpatialIndex]) -> bool:
+    if index is None:
+        return False
+    return time.monotonic() - index.built_at < settings.PARTNER_INDEX_TTL
+
+
+def get_partner_index() -> PartnerSpatialIndex:
+    """
+    Returns the partner index of this worker, building it lazily.
+    """
+    global _index
+
+    index = _index
+    if _is_fresh(index):
+        return index
+
+    with _index_lock:
+        if not _is_fresh(_index):
+            _index = build_partner_index()
+        return _index
+
+
+def invalidate_partner_index():
+    global _index
+    _index = None
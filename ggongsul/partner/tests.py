@@ -0,0 +1,169 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from ggongsul.core.mixins import bump_response_version
+
+from .cards import CARD_CACHES
+from .models import Partner, PartnerCategory
+from .projections import map_info_rows, short_info_rows
+from .serializers import PartnerMapInfoSerializer, PartnerShortInfoSerializer
+from .spatial_index import invalidate_partner_index
+
+TEST_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+    },
+}
+
+
+def create_partners(cnt: int, category: PartnerCategory = None):
+    partners = []
+    for i in range(cnt):
+        partner = Partner.objects.create(
+            name=f"업체{i}",
+            address=f"서울 강남구 {i}",
+            contact_name="대표",
+            contact_phone="010",
+            is_active=True,
+            latitude=37.5 + i * 0.001,
+            longitude=127.0 + i * 0.001,
+        )
+        detail = partner.detail
+        detail.category = category
+        detail.short_desc = f"간단 설명 {i}"
+        detail.detail_desc = "상세 설명"
+        detail.save()
+        partners.append(partner)
+    return partners
+
+
+def reset_partner_caches():
+    caches["shared"].clear()
+    for card_cache in CARD_CACHES.values():
+        card_cache.cache._local.clear()
+    invalidate_partner_index()
+
+
+@override_settings(CACHES=TEST_CACHES)
+class PartnerQueryCountTest(APITestCase):
+    """
+    The number of queries of partner apis should not grow with the number of
+    partners.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        category = PartnerCategory.objects.create(name="술집")
+        cls.partners = create_partners(10, category)
+
+    def setUp(self):
+        reset_partner_caches()
+
+    def test_list(self):
+        # 변경 시각 조회, 업체 id 조회, 카드 생성
+        with self.assertNumQueries(3):
+            resp = self.client.get("/api/v1/partners/", format="json")
+        self.assertEqual(len(resp.json()), 10)
+
+        # 같은 요청은 변경 시각만 조회한 뒤 캐싱된 응답을 사용한다.
+        with self.assertNumQueries(1):
+            self.client.get("/api/v1/partners/", format="json")
+
+    def test_list_long(self):
+        with self.assertNumQueries(2):
+            resp = self.client.get("/api/v1/partners/?info=long", format="json")
+        self.assertEqual(len(resp.json()), 10)
+
+    def test_near(self):
+        # index 를 만들 때만 조회한다.
+        with self.assertNumQueries(2):
+            resp = self.client.get(
+                "/api/v1/partners/near/?lat=37.5&lng=127.0", format="json"
+            )
+        self.assertEqual(len(resp.json()), 10)
+
+        with self.assertNumQueries(0):
+            self.client.get("/api/v1/partners/near/?lat=37.5&lng=127.0&k=3")
+
+    def test_near_long(self):
+        with self.assertNumQueries(1):
+            resp = self.client.get(
+                "/api/v1/partners/near/?lat=37.5&lng=127.0&info=long", format="json"
+            )
+        self.assertEqual(len(resp.json()), 10)
+
+    def test_retrieve(self):
+        with self.assertNumQueries(2):
+            resp = self.client.get(
+                f"/api/v1/partners/{self.partners[0].id}/", format="json"
+            )
+        self.assertEqual(resp.json()["category"], "술집")
+
+
+class PartnerProjectionTest(APITestCase):
+    """
+    Rows built from values() should be the same as the serializer output.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        category = PartnerCategory.objects.create(name="술집")
+        create_partners(2, category)
+        # 카테고리, 좌표가 없는 업체
+        partner = create_partners(1)[0]
+        partner.latitude = partner.longitude = None
+        partner.save()
+
+    def assertSameAsSerializer(self, rows, serializer_class):
+        queryset = serializer_class.setup_eager_loading(Partner.objects.order_by("id"))
+        self.assertEqual(rows, serializer_class(queryset, many=True).data)
+
+    def test_map_info_rows(self):
+        rows = map_info_rows(Partner.objects.order_by("id"))
+        self.assertSameAsSerializer(rows, PartnerMapInfoSerializer)
+        self.assertIsNone(rows[-1]["latitude"])
+
+    def test_short_info_rows(self):
+        rows = short_info_rows(Partner.objects.order_by("id"))
+        self.assertSameAsSerializer(rows, PartnerShortInfoSerializer)
+        self.assertIsNone(rows[-1]["category"])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SharedCacheOutageTest(APITestCase):
+    """
+    Partner apis should keep working without the shared cache.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        category = PartnerCategory.objects.create(name="술집")
+        cls.partners = create_partners(3, category)
+
+    def setUp(self):
+        reset_partner_caches()
+        broken = mock.MagicMock()
+        for method in ("get", "set", "add", "incr", "get_many", "set_many"):
+            getattr(broken, method).side_effect = Exception("shared cache is down")
+        patcher = mock.patch("ggongsul.core.mixins.caches", {"shared": broken})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_list(self):
+        resp = self.client.get("/api/v1/partners/", format="json")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json()), 3)
+        # version 을 모르므로 ETag 없이 응답한다.
+        self.assertNotIn("ETag", resp)
+
+    def test_retrieve(self):
+        resp = self.client.get(f"/api/v1/partners/{self.partners[0].id}/")
+        self.assertEqual(resp.status_code, 200)
+
+    def test_bump_response_version(self):
+        bump_response_version("partner")
@@ -1,12 +1,15 @@
 import datetime
 import logging
 
-from django.http import HttpResponseBadRequest
+from typing import List, Optional
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBadRequest
 
 from django.shortcuts import get_object_or_404, resolve_url
 from rest_framework import permissions
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.renderers import (
     TemplateHTMLRenderer,
@@ -16,7 +19,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from .cards import CARD_CACHES, PartnerCardCache, join_cards
+from .filters import PartnerSearchFilterBackend
+from .map_tiles import viewport_clusters
 from .models import PartnerDetail, PartnerAgreement, Partner
+from .search import search_partners
 from .serializers import (
     PartnerDetailSerializer,
     PartnerAgreementSerializer,
@@ -24,7 +31,13 @@ from .serializers import (
     PartnerShortInfoSerializer,
     PartnerDetailInfoSerializer,
 )
+from .search_index import get_search_index
+from .spatial_index import get_partner_index
 from ..core.filters import DistanceFilterBackend
+from ..core.mixins import ConditionalGetMixin
+from ..core.paginations import NearCursorOptInPagination
+from ..core.renderers import is_plain_json
+from ..core.validators import validate_bbox, validate_lat_lng
 
 logger = logging.getLogger(__name__)
 
@@ -123,16 +136,35 @@ class PartnerAgreementView(APIView):
         return Response({})
 
 
-class PartnerViewSet(ReadOnlyModelViewSet):
+class PartnerViewSet(ConditionalGetMixin, ReadOnlyModelViewSet):
     queryset = Partner.objects.filter(is_active=True)
     permission_classes = [permissions.AllowAny]
-    search_fields = ["name"]
+
+    last_modified_fields = ("updated_on", "detail__updated_on")
+    cache_control = {
+        "list": {"public": True, "max_age": 60},
+        "retrieve": {"public": True, "max_age": 60},
+    }
+    # 카테고리 변경은 updated_on 에 드러나지 않으므로 signal 로 version 을 올린다.
+    response_version_name = "partner"
+    response_cache_timeout = 60 * 60
 
     @property
     def filter_backends(self):
         if self.action == "near_partners":
             return [DistanceFilterBackend]
-        return [SearchFilter]
+        return [PartnerSearchFilterBackend]
+
+    @property
+    def pagination_class(self):
+        if self.action == "near_partners":
+            return NearCursorOptInPagination
+        return None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # 선택된 serializer 가 사용하는 연관 정보를 한번에 조회한다.
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     def get_serializer_class(self):
         info_level = self.request.query_params.get("info", None)
@@ -147,6 +179,129 @@ class PartnerViewSet(ReadOnlyModelViewSet):
             return PartnerDetailInfoSerializer
         return PartnerMapInfoSerializer
 
+    def get_card_cache(self) -> Optional[PartnerCardCache]:
+        if self.paginator is not None or not is_plain_json(self.request):
+            return None
+        return CARD_CACHES.get(self.get_serializer_class())
+
+    def card_response(self, cards: List[bytes]) -> HttpResponse:
+        return HttpResponse(
+            join_cards(cards), content_type=self.request.accepted_renderer.media_type
+        )
+
+    def list(self, request: Request, *args, **kwargs):
+        if self.get_card_cache() is None:
+            return super().list(request, *args, **kwargs)
+        return self.conditional_response(self.list_cards, request, *args, **kwargs)
+
+    def list_cards(self, request: Request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        partner_ids = list(queryset.values_list("id", flat=True))
+        return self.card_response(self.get_card_cache().get_many(partner_ids))
+
+    @property
+    def distance_num_km(self) -> float:
+        radius = self.request.query_params.get("radius", None)
+        if radius is None:
+            return settings.PARTNER_NEAR_DEFAULT_RADIUS_KM
+
+        try:
+            radius = float(radius)
+        except ValueError:
+            raise ValidationError({"msg": "'radius' query param should be float!"})
+
+        if not radius > 0:
+            raise ValidationError({"msg": "'radius' query param should be positive!"})
+        return min(radius, settings.PARTNER_NEAR_MAX_RADIUS_KM)
+
+    def get_nearest_cnt(self) -> Optional[int]:
+        k = self.request.query_params.get("k", None)
+        if k is None:
+            return None
+
+        if not k.isdigit() or int(k) < 1:
+            raise ValidationError(
+                {"msg": "'k' query param should be positive integer!"}
+            )
+        return int(k)
+
+    def get_zoom(self) -> int:
+        zoom = self.request.query_params.get("zoom", None)
+        if zoom is None or not zoom.isdigit():
+            raise ValidationError({"msg": "'zoom' query param should be integer!"})
+        return min(int(zoom), settings.PARTNER_MAP_MAX_ZOOM)
+
+    def get_offer_type(self) -> Optional[int]:
+        offer_type = self.request.query_params.get("offer_type", None)
+        if offer_type is None:
+            return None
+
+        if (
+            not offer_type.isdigit()
+            or int(offer_type) not in PartnerDetail.OfferType.values
+        ):
+            raise ValidationError({"msg": "'offer_type' query param is invalid!"})
+        return int(offer_type)
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request: Request):
+        params = request.query_params
+
+        lat = lng = None
+        if "lat" in params or "lng" in params:
+            lat, lng = validate_lat_lng(params)
+
+        open_at = None
+        if params.get("open_now", None) in ("true", "1"):
+            open_at = datetime.datetime.now().time()
+
+        return Response(
+            search_partners(
+                lat=lat,
+                lng=lng,
+                radius_km=self.distance_num_km,
+                query=params.get("q", "").strip(),
+                category=params.get("category", None),
+                offer_type=self.get_offer_type(),
+                open_at=open_at,
+                limit=settings.PARTNER_SEARCH_MAX_RESULTS,
+            )
+        )
+
+    @action(detail=False, methods=["get"], url_path="autocomplete")
+    def autocomplete(self, request: Request):
+        found = get_search_index().autocomplete(
+            request.query_params.get("q", ""),
+            limit=settings.PARTNER_AUTOCOMPLETE_LIMIT,
+        )
+        return Response([{"id": pk, "name": name} for pk, name in found])
+
+    @action(detail=False, methods=["get"], url_path="map")
+    def map_clusters(self, request: Request):
+        min_lat, max_lat, min_lng, max_lng = validate_bbox(request.query_params)
+        return Response(
+            viewport_clusters(min_lat, max_lat, min_lng, max_lng, self.get_zoom())
+        )
+
     @action(detail=False, methods=["get"], url_path="near")
     def near_partners(self, request: Request):
-        return self.list(request)
+        # 간략한 정보가 아닌 경우에는 DB 에서 직접 조회한다.
+        if self.get_serializer_class() is not PartnerShortInfoSerializer:
+            return self.list(request)
+
+        lat, lng = validate_lat_lng(request.query_params)
+        k = self.get_nearest_cnt()
+        index = get_partner_index()
+
+        if k:
+            found = index.nearest(lat, lng, k, max_radius_km=self.distance_num_km)
+        else:
+            found = index.within(lat, lng, self.distance_num_km)
+
+        page = self.paginator.paginate_sorted(found, request, view=self)
+        if page is not None:
+            return self.get_paginated_response([point.payload for _, point in page])
+
+        if is_plain_json(request):
+            return self.card_response([point.card for _, point in found])
+        return Response([point.payload for distance, point in found])
@@ -3,10 +3,13 @@ from __future__ import annotations
 import os
 import uuid
 
+from typing import Optional, Tuple
+
 from django.db import models
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
+from ggongsul.common.counters import CountedMixin
 from ggongsul.member.models import Member
 from ggongsul.visitation.models import Visitation
 from ggongsul.partner.models import Partner
@@ -25,7 +28,7 @@ class PathAndRename:
         return os.path.join(self.path, renamed_filename)
 
 
-class Review(models.Model):
+class Review(CountedMixin, models.Model):
     class RatingScore(models.IntegerChoices):
         ONE = 1, _("⭐")
         TWO = 2, _("⭐⭐")
@@ -75,6 +78,30 @@ class Review(models.Model):
     def __repr__(self):
         return self.__str__()
 
+    COUNTED_FIELDS = ("partner_id", "is_deleted", "rating_score")
+
+    def counted_value(self, values: dict) -> Optional[Tuple[int, int]]:
+        """
+        Returns (partner id, rating score) the review adds to the partner's
+        review stats, None if it is not counted.
+        """
+        if values["partner_id"] is None or values["is_deleted"]:
+            return None
+        return values["partner_id"], values["rating_score"]
+
+    def update_counters(
+        self, old_stats: Optional[Tuple[int, int]], new_stats: Optional[Tuple[int, int]]
+    ):
+        # 같은 업체 안에서 별점만 바뀐 경우
+        if old_stats and new_stats and old_stats[0] == new_stats[0]:
+            Partner.add_review_stats(old_stats[0], 0, new_stats[1] - old_stats[1])
+            return
+
+        if old_stats:
+            Partner.add_review_stats(old_stats[0], -1, -old_stats[1])
+        if new_stats:
+            Partner.add_review_stats(new_stats[0], 1, new_stats[1])
+
 
 class ReviewImage(models.Model):
     review = models.ForeignKey(
@@ -0,0 +1,9 @@
+from django.db.models.signals import post_delete, pre_delete
+
+from ggongsul.common.counters import counted_post_delete, counted_pre_delete
+
+from .models import Review
+
+# queryset 으로 삭제된 리뷰도 업체의 리뷰 통계에서 뺀다.
+pre_delete.connect(counted_pre_delete, sender=Review)
+post_delete.connect(counted_post_delete, sender=Review)
@@ -0,0 +1,111 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ggongsul.member.models import Member
+from ggongsul.partner.models import Partner
+
+from .models import Review
+
+
+def create_partner(name: str = "업체") -> Partner:
+    return Partner.objects.create(
+        name=name, address="서울", contact_name="대표", contact_phone="010"
+    )
+
+
+class ReviewStatsTest(TestCase):
+    """
+    review_count and review_rating_sum of the partner should follow its
+    undeleted reviews.
+    """
+
+    def setUp(self):
+        self.member = Member.objects.create_user(username="member", password="pw")
+        self.partner = create_partner()
+
+    def assertStats(self, review_count: int, review_rating_sum: int, partner=None):
+        partner = Partner.objects.get(id=(partner or self.partner).id)
+        self.assertEqual(
+            (partner.review_count, partner.review_rating_sum),
+            (review_count, review_rating_sum),
+        )
+
+    def create_review(self, rating_score: int) -> Review:
+        return Review.objects.create(
+            partner=self.partner,
+            member=self.member,
+            body="리뷰",
+            rating_score=rating_score,
+        )
+
+    def test_create(self):
+        self.create_review(5)
+        self.create_review(3)
+        self.assertStats(2, 8)
+
+    def test_rerate(self):
+        review = self.create_review(5)
+        review.rating_score = 2
+        review.save()
+        self.assertStats(1, 2)
+
+    def test_move_partner(self):
+        review = self.create_review(4)
+        other = create_partner("다른 업체")
+
+        review.partner = other
+        review.save()
+        self.assertStats(0, 0)
+        self.assertStats(1, 4, partner=other)
+
+    def test_soft_delete(self):
+        review = self.create_review(5)
+        review.is_deleted = True
+        review.save()
+        self.assertStats(0, 0)
+
+        # 삭제된 리뷰의 별점을 바꿔도 통계는 그대로다.
+        review.rating_score = 1
+        review.save()
+        self.assertStats(0, 0)
+
+    def test_hard_delete(self):
+        self.create_review(5)
+        self.create_review(3).delete()
+        self.assertStats(1, 5)
+
+    def test_stale_copies(self):
+        self.create_review(5)
+        first, second = Review.objects.get(), Review.objects.get()
+
+        first.is_deleted = second.is_deleted = True
+        first.save()
+        second.save()
+        self.assertStats(0, 0)
+
+    def test_stale_delete(self):
+        self.create_review(5)
+        first, second = Review.objects.get(), Review.objects.get()
+
+        first.delete()
+        second.delete()
+        self.assertStats(0, 0)
+
+    def test_queryset_delete(self):
+        self.create_review(5)
+        self.create_review(3)
+
+        Review.objects.filter(partner=self.partner).delete()
+        self.assertStats(0, 0)
+
+    def test_reconcile(self):
+        self.create_review(5)
+        self.create_review(3).delete()
+        Partner.objects.filter(id=self.partner.id).update(
+            review_count=4, review_rating_sum=1
+        )
+
+        call_command("reconcile_review_stats", stdout=mock.MagicMock())
+        self.assertStats(1, 5)
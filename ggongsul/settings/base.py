@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     "ckeditor",
     "django_filters",
     "django_celery_beat",
+    "ggongsul.common",
     "ggongsul.member",
     "ggongsul.partner",
     "ggongsul.agreement",
@@ -190,17 +191,102 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": [
+        "ggongsul.core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "ggongsul.core.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
+# Cache Settings
+# shared 캐시는 uwsgi, celery worker 가 함께 사용하며, table 은 web 컨테이너 시작 시 `createcachetable` 로 만든다.
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "ggongsul_shared_cache",
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
+}
+
+# External api http client Settings
+HTTP_CLIENT_TIMEOUT = (3.05, 10)  # (connect, read) 초
+HTTP_CLIENT_POOL_CONNECTIONS = 4
+HTTP_CLIENT_POOL_MAXSIZE = 16
+HTTP_CLIENT_MAX_RETRIES = 3
+HTTP_CLIENT_BACKOFF_FACTOR = 0.3
+
+# Iamport Settings
+# 만료 IMP_TOKEN_REFRESH_MARGIN 초 전에 access token 을 미리 갱신한다.
+IMP_TOKEN_REFRESH_MARGIN = 60
+
+# Geocode cache Settings
+# 좌표는 소수점 GEOCODE_CACHE_PRECISION 자리(3 자리 = 약 100m) 격자로 묶어서 캐싱한다.
+GEOCODE_CACHE_PRECISION = 3
+GEOCODE_CACHE_TTL = 60 * 60 * 24 * 30
+GEOCODE_CACHE_MAX_SIZE = 4096
+GEOCODE_CACHE_STATS_FLUSH_INTERVAL = 100
+
+# Partner spatial index Settings
+# signal 로 무효화되지 않는 다른 worker 의 index 는 TTL(초) 이 지나면 다시 만들어진다.
+PARTNER_INDEX_TTL = 60 * 5
+PARTNER_INDEX_CELL_SIZE = 0.05
+PARTNER_NEAR_DEFAULT_RADIUS_KM = 5
+PARTNER_NEAR_MAX_RADIUS_KM = 30
+
+# Partner map cluster Settings
+# 지도 tile 을 PARTNER_MAP_TILE_GRID x PARTNER_MAP_TILE_GRID 칸으로 나누어 칸마다 업체를 묶는다.
+PARTNER_MAP_TILE_GRID = 4
+PARTNER_MAP_CLUSTER_MAX_ZOOM = 16  # 이 zoom 이상에서는 묶지 않고 업체를 그대로 응답한다.
+PARTNER_MAP_MAX_ZOOM = 21
+PARTNER_MAP_MAX_TILES = 64
+PARTNER_MAP_TILE_CACHE_SIZE = 4096
+
+# Partner search Settings
+# 검색 index 는 signal 로 현재 worker 에서만 갱신되므로 다른 worker 는 TTL(초) 이 지나면 다시 만든다.
+PARTNER_SEARCH_INDEX_TTL = 60 * 5
+PARTNER_SEARCH_MAX_RESULTS = 200
+PARTNER_AUTOCOMPLETE_LIMIT = 10
+
+# Partner card cache Settings
+# 업체 목록 응답은 업체별로 캐싱된 json 조각을 이어 붙여서 만든다. (`warm_partner_cards` 로 미리 채울 수 있다.)
+PARTNER_CARD_CACHE_TTL = 60 * 60 * 24
+PARTNER_CARD_CACHE_LOCAL_TTL = 60
+PARTNER_CARD_CACHE_MAX_SIZE = 20000
+
+# Agreement payload cache Settings
+# 다른 worker 의 local 캐시는 약관 수정 후 최대 AGREEMENT_CACHE_LOCAL_TTL 초 동안 이전 본문을 응답한다.
+AGREEMENT_CACHE_TTL = 60 * 60 * 24 * 7
+AGREEMENT_CACHE_LOCAL_TTL = 60
+AGREEMENT_CACHE_MAX_SIZE = 64
+
 # Celery base Settings
 CELERY_TIMEZONE = "Asia/Seoul"
 CELERY_ENABLE_UTC = False
 CELERY_TASK_QUEUES = {
     Queue("tasks.slow", routing_key="slow_task.#"),
     Queue("tasks.fast", routing_key="fast_task.#"),
+    Queue("tasks.renewal", routing_key="renewal_task.#"),
 }
 CELERY_TASK_DEFAULT_QUEUE = "tasks.fast"
-CELERY_TASK_ROUTES = {"ggongsul.membership.tasks.check_expire_membership": "tasks.slow"}
+CELERY_TASK_ROUTES = {
+    "ggongsul.membership.tasks.check_expire_membership": "tasks.slow",
+    # 구독 갱신 묶음은 여러 프로세스가 동시에 처리하도록 별도 queue 로 보낸다.
+    "ggongsul.membership.tasks.renew_subscriptions": "tasks.renewal",
+}
+
+# Membership Settings
+# 구독 갱신은 MEMBERSHIP_RENEWAL_CHUNK_SIZE 명씩 묶어서 renewal-worker 에서 병렬로 처리한다.
+MEMBERSHIP_RENEWAL_CHUNK_SIZE = 500
+# 실패한 결제는 생성된 뒤 MEMBERSHIP_PAYMENT_RETRY_DAYS 일 동안 매일 갱신 작업에서 다시 시도하며,
+# MEMBERSHIP_PAYMENT_MAX_ATTEMPTS 번 결제하지 못하면 중단하고 멤버십을 비활성화한다.
+MEMBERSHIP_PAYMENT_MAX_ATTEMPTS = 3
+MEMBERSHIP_PAYMENT_RETRY_DAYS = 3
 
 # Celery Beat base Settings
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
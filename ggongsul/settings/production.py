@@ -55,9 +55,9 @@ DATABASES = {
     },
 }
 
-# REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
-#     "rest_framework.renderers.JSONRenderer",
-# ]
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
+    "ggongsul.core.renderers.ORJSONRenderer",
+]
 
 # Celery Settings
 CELERY_BROKER_URL = ENV_CONFIG["celery"]["broker"]
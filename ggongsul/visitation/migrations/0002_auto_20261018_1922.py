@@ -0,0 +1,20 @@
+# Generated by Django 3.1.14 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("visitation", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="visitation",
+            index=models.Index(
+                fields=["member", "created_on", "id"],
+                name="visitation__member__4d2783_idx",
+            ),
+        ),
+    ]
@@ -40,3 +40,4 @@ class Visitation(models.Model):
         ordering = ["-created_on"]
         verbose_name = _("방문 기록")
         verbose_name_plural = _("방문 기록")
+        indexes = [models.Index(fields=["member", "created_on", "id"])]
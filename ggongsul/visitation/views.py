@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import mixins
@@ -5,8 +6,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import GenericViewSet
 
 from ggongsul.core.filters import MemberFilterBackend
-from ggongsul.core.paginations import SmallResultsSetPagination
+from ggongsul.core.paginations import CursorOptInPagination
 from ggongsul.core.permissions import HasMembershipBenefits
+from ggongsul.member.models import Member
+from ggongsul.member.serializers import MemberSerializer
 from ggongsul.visitation.models import Visitation
 from ggongsul.visitation.serializers import (
     VisitationSerializer,
@@ -21,10 +24,19 @@ class VisitationViewSet(
     GenericViewSet,
 ):
     # partner정보가 남아있는 것을 기준으로 넘겨준다.
-    queryset = Visitation.objects.filter(partner__isnull=False)
+    queryset = (
+        Visitation.objects.filter(partner__isnull=False)
+        .select_related("partner__detail__category")
+        .prefetch_related(
+            Prefetch(
+                "member",
+                queryset=MemberSerializer.setup_eager_loading(Member.objects.all()),
+            )
+        )
+    )
     filter_backends = [MemberFilterBackend, DjangoFilterBackend]
     filterset_fields = ["partner"]
-    pagination_class = SmallResultsSetPagination
+    pagination_class = CursorOptInPagination
 
     @property
     def permission_classes(self):